@@ -5,6 +5,7 @@
 
 import { createLogger } from "../utils/logger.js";
 import { tradingDb } from "../models/database.js";
+import { bisectLeft, bisectRight } from "../utils/bisect.js";
 import type { PairConfig } from "../types/portfolio.js";
 
 const logger = createLogger("backtesting");
@@ -63,12 +64,23 @@ interface GridLevel {
 export class GridBacktester {
   private config: BacktestConfig;
   private gridLevels: GridLevel[] = [];
+  private levelPrices: Float64Array = new Float64Array(0); // Ascending
   private trades: BacktestTrade[] = [];
   private positionSize: number = 0;
   private cash: number;
   private equity: number;
-  private equityCurve: Array<{ timestamp: Date; equity: number }> = [];
+  // Equity curve stored column-wise (one number per tick in each array)
+  // and only turned into { timestamp, equity } objects for the result
+  private equityTimes: number[] = [];
+  private equityValues: number[] = [];
   private feeRate: number = 0.001; // Binance.US 0.1% fee
+  // Level range and price of the last tick whose scan traded nothing; null
+  // after a tick that traded
+  private quietScan: {
+    sellEnd: number;
+    buyStart: number;
+    price: number;
+  } | null = null;
 
   constructor(config: BacktestConfig) {
     this.config = config;
@@ -84,15 +96,20 @@ export class GridBacktester {
     const range = this.config.gridUpper - this.config.gridLower;
     const spacing = range / this.config.gridCount;
 
+    this.levelPrices = new Float64Array(this.config.gridCount + 1);
     for (let i = 0; i <= this.config.gridCount; i++) {
-      const price = this.config.gridLower + i * spacing;
-      this.gridLevels.push({
-        level: i,
-        price,
-        status: "empty",
-      });
+      this.levelPrices[i] = this.config.gridLower + i * spacing;
     }
 
+    // Every field is present from the start (buyPrice included), so all
+    // levels share one object shape instead of changing it on first buy
+    this.gridLevels = Array.from(this.levelPrices, (price, level) => ({
+      level,
+      price,
+      status: "empty" as const,
+      buyPrice: undefined,
+    }));
+
     logger.info(
       {
         symbol: this.config.symbol,
@@ -127,22 +144,21 @@ export class GridBacktester {
       ),
     );
 
-    // Filter prices within date range
-    const filteredPrices = priceHistory.filter((p) => {
-      const timestamp = new Date(p.timestamp);
-      return (
-        timestamp >= this.config.startDate && timestamp <= this.config.endDate
-      );
-    });
+    // Filter prices within date range (compare epoch ms, no Date per point)
+    const startMs = this.config.startDate.getTime();
+    const endMs = this.config.endDate.getTime();
+    const filteredPrices = priceHistory.filter(
+      (p) => p.timestamp >= startMs && p.timestamp <= endMs,
+    );
 
     logger.info(
       { dataPoints: filteredPrices.length },
       "Loaded historical price data",
     );
 
-    // Process each price point
+    // Process each price point; a Date is only built when a trade is recorded
     for (const pricePoint of filteredPrices) {
-      this.processPriceUpdate(pricePoint.price, new Date(pricePoint.timestamp));
+      this.processPriceUpdate(pricePoint.price, pricePoint.timestamp);
     }
 
     // Calculate final metrics
@@ -164,33 +180,65 @@ export class GridBacktester {
 
   /**
    * Process a price update and check for grid triggers
+   * @param timestamp Epoch ms of the price point
    */
-  private processPriceUpdate(price: number, timestamp: Date): void {
-    // Check for sell triggers (price hits upper levels)
-    for (const level of this.gridLevels) {
-      if (level.status === "bought" && price >= level.price) {
-        // Sell at this level
-        this.executeSell(level, price, timestamp);
+  private processPriceUpdate(price: number, timestamp: number): void {
+    const levels = this.gridLevels;
+    const sellEnd = bisectRight(this.levelPrices, price);
+    const buyStart = bisectLeft(this.levelPrices, price);
+
+    // Most ticks stay between the same two levels. If the last scan over
+    // this range traded nothing, level states and cash are unchanged, and a
+    // price no lower than that scan's cannot make a buy affordable, so
+    // this tick cannot trigger anything either.
+    const quiet = this.quietScan;
+    const skipScan =
+      quiet !== null &&
+      quiet.sellEnd === sellEnd &&
+      quiet.buyStart === buyStart &&
+      price >= quiet.price;
+
+    if (!skipScan) {
+      const tradesBefore = this.trades.length;
+
+      // Check for sell triggers (price hits upper levels). Only levels at or
+      // below the price can trigger, so bisect instead of scanning the grid.
+      for (let i = 0; i < sellEnd; i++) {
+        if (levels[i].status === "bought") {
+          // Sell at this level
+          this.executeSell(levels[i], price, timestamp);
+        }
       }
-    }
 
-    // Check for buy triggers (price hits lower levels)
-    for (const level of this.gridLevels) {
-      if (level.status === "empty" && price <= level.price) {
-        // Buy at this level
-        this.executeBuy(level, price, timestamp);
+      // Check for buy triggers (price hits lower levels), i.e. levels at or
+      // above the price
+      for (let i = buyStart; i < levels.length; i++) {
+        if (levels[i].status === "empty") {
+          // Buy at this level
+          this.executeBuy(levels[i], price, timestamp);
+        }
       }
+
+      this.quietScan =
+        this.trades.length === tradesBefore
+          ? { sellEnd, buyStart, price }
+          : null;
     }
 
     // Update equity curve
     this.equity = this.cash + this.positionSize * price;
-    this.equityCurve.push({ timestamp, equity: this.equity });
+    this.equityTimes.push(timestamp);
+    this.equityValues.push(this.equity);
   }
 
   /**
    * Execute a buy order
    */
-  private executeBuy(level: GridLevel, price: number, timestamp: Date): void {
+  private executeBuy(
+    level: GridLevel,
+    price: number,
+    timestamp: number,
+  ): void {
     const cost = this.config.amountPerGrid * price;
     const fee = cost * this.feeRate;
 
@@ -205,7 +253,7 @@ export class GridBacktester {
     level.buyPrice = price;
 
     this.trades.push({
-      timestamp,
+      timestamp: new Date(timestamp),
       side: "BUY",
       price,
       quantity: this.config.amountPerGrid,
@@ -217,7 +265,11 @@ export class GridBacktester {
   /**
    * Execute a sell order
    */
-  private executeSell(level: GridLevel, price: number, timestamp: Date): void {
+  private executeSell(
+    level: GridLevel,
+    price: number,
+    timestamp: number,
+  ): void {
     const revenue = this.config.amountPerGrid * price;
     const fee = revenue * this.feeRate;
     const buyPrice = level.buyPrice || level.price;
@@ -229,7 +281,7 @@ export class GridBacktester {
     level.buyPrice = undefined;
 
     this.trades.push({
-      timestamp,
+      timestamp: new Date(timestamp),
       side: "SELL",
       price,
       quantity: this.config.amountPerGrid,
@@ -256,13 +308,14 @@ export class GridBacktester {
     const totalReturn = (totalPnl / this.config.initialCapital) * 100;
 
     // Calculate max drawdown
+    const equityValues = this.equityValues;
     let peak = this.config.initialCapital;
     let maxDrawdown = 0;
-    for (const point of this.equityCurve) {
-      if (point.equity > peak) {
-        peak = point.equity;
+    for (const equity of equityValues) {
+      if (equity > peak) {
+        peak = equity;
       }
-      const drawdown = peak - point.equity;
+      const drawdown = peak - equity;
       if (drawdown > maxDrawdown) {
         maxDrawdown = drawdown;
       }
@@ -271,9 +324,9 @@ export class GridBacktester {
 
     // Calculate Sharpe Ratio (simplified - using daily returns)
     const returns: number[] = [];
-    for (let i = 1; i < this.equityCurve.length; i++) {
-      const prevEquity = this.equityCurve[i - 1].equity;
-      const currEquity = this.equityCurve[i].equity;
+    for (let i = 1; i < equityValues.length; i++) {
+      const prevEquity = equityValues[i - 1];
+      const currEquity = equityValues[i];
       const dailyReturn = (currEquity - prevEquity) / prevEquity;
       returns.push(dailyReturn);
     }
@@ -328,7 +381,10 @@ export class GridBacktester {
       fees,
       netPnl: totalPnl,
       trades: this.trades,
-      equityCurve: this.equityCurve,
+      equityCurve: equityValues.map((equity, i) => ({
+        timestamp: new Date(this.equityTimes[i]),
+        equity,
+      })),
     };
   }
 }
@@ -426,15 +482,17 @@ export function optimizeGridParameters(
 
         results.push({ config, metrics });
 
-        logger.debug(
-          {
-            gridCount,
-            range: `±${(rangeMultiplier * 100).toFixed(0)}%`,
-            return: `${metrics.totalReturn.toFixed(2)}%`,
-            sharpe: metrics.sharpeRatio.toFixed(2),
-          },
-          "Backtest result",
-        );
+        if (logger.isLevelEnabled("debug")) {
+          logger.debug(
+            {
+              gridCount,
+              range: `±${(rangeMultiplier * 100).toFixed(0)}%`,
+              return: `${metrics.totalReturn.toFixed(2)}%`,
+              sharpe: metrics.sharpeRatio.toFixed(2),
+            },
+            "Backtest result",
+          );
+        }
       } catch (error) {
         logger.warn({ error, config }, "Backtest failed for config");
       }
@@ -1,7 +1,9 @@
+import { performance } from "perf_hooks";
 import { createLogger } from "../utils/logger.js";
-import { config, getGridLevels } from "../utils/config.js";
+import { config, computeGridLevels } from "../utils/config.js";
 import { BinanceClient } from "../exchange/binance.js";
 import { RiskManager } from "./risk.js";
+import { bisectLeft, bisectRight } from "../utils/bisect.js";
 import type {
   GridConfig,
   Order,
@@ -11,17 +13,45 @@ import type {
 
 const logger = createLogger("grid");
 
+// Initial grid orders are submitted in concurrent batches of this size
+const INITIAL_ORDER_BATCH_SIZE = 10;
+
+interface GridBotStatus {
+  status: BotStatus;
+  currentPrice: number;
+  gridConfig: GridConfig;
+  activeOrdersCount: number;
+  totalPnl: number;
+  tradesCount: number;
+  uptime: number;
+  riskReport: Record<string, unknown>;
+}
+
 export class GridBot {
   private client: BinanceClient;
   private riskManager: RiskManager;
   private gridConfig: GridConfig;
-  private gridLevels: GridLevel[] = [];
+  private gridLevels: GridLevel[] = []; // Indexed by level number
+  private levelPrices: Float64Array = new Float64Array(0); // Ascending
   private activeOrders: Map<string, Order> = new Map();
+  private activeOrdersSnapshot: readonly Order[] | null = null;
+  private pendingOrders = 0; // Orders submitted but not yet acknowledged
   private status: BotStatus = "stopped";
   private currentPrice = 0;
   private totalPnl = 0;
   private tradesCount = 0;
-  private startTime: Date | null = null;
+  private startedAt: number | null = null; // Monotonic clock, ms
+  // Reused by getStatus(); callers serialize it immediately
+  private statusSnapshot: GridBotStatus | null = null;
+
+  // Stream handlers are bound once so every start() registers the same
+  // references and stop() can unregister them
+  private readonly onPrice = (price: number): void => {
+    this.handlePriceUpdate(price);
+  };
+  private readonly onOrder = (order: Order): void => {
+    void this.handleOrderUpdate(order);
+  };
 
   constructor(client: BinanceClient, riskManager: RiskManager) {
     this.client = client;
@@ -49,12 +79,15 @@ export class GridBot {
       // Connect to exchange
       await this.client.connect();
 
-      // Initialize balance for risk manager
-      const balance = await this.client.getBalance(config.quoteAsset);
+      // Balance (for the risk manager) and current price are independent
+      // requests, so fetch them together
+      const [balance, currentPrice] = await Promise.all([
+        this.client.getBalance(config.quoteAsset),
+        this.client.getCurrentPrice(),
+      ]);
       this.riskManager.updateBalance(balance.total);
 
-      // Get current price
-      this.currentPrice = await this.client.getCurrentPrice();
+      this.currentPrice = currentPrice;
       logger.info({ currentPrice: this.currentPrice }, "Current price fetched");
 
       // Initialize grid levels
@@ -65,16 +98,14 @@ export class GridBot {
 
       // Start price stream
       this.client.startPriceStream();
-      this.client.onPriceUpdate((price) => this.handlePriceUpdate(price));
+      this.client.onPriceUpdate(this.onPrice);
 
       // Start user stream for order updates
       this.client.startUserStream();
-      this.client.onOrderUpdate((order) => {
-        void this.handleOrderUpdate(order);
-      });
+      this.client.onOrderUpdate(this.onOrder);
 
       this.status = "running";
-      this.startTime = new Date();
+      this.startedAt = performance.now();
       logger.info("Grid bot started successfully");
     } catch (error) {
       this.status = "error";
@@ -93,9 +124,14 @@ export class GridBot {
       logger.info("Stopping grid bot...");
       this.status = "stopping";
 
+      // Stop receiving stream updates
+      this.client.offPriceUpdate(this.onPrice);
+      this.client.offOrderUpdate(this.onOrder);
+
       // Cancel all open orders
       await this.client.cancelAllOrders();
       this.activeOrders.clear();
+      this.activeOrdersSnapshot = null;
 
       // Disconnect from exchange
       this.client.disconnect();
@@ -110,7 +146,14 @@ export class GridBot {
   }
 
   private initializeGridLevels(): void {
-    const prices = getGridLevels();
+    const { lowerPrice, upperPrice, gridCount, gridType } = this.gridConfig;
+    const prices = computeGridLevels(
+      lowerPrice,
+      upperPrice,
+      gridCount,
+      gridType,
+    );
+    this.levelPrices = Float64Array.from(prices);
     this.gridLevels = prices.map((price, index) => ({
       level: index,
       price,
@@ -126,17 +169,14 @@ export class GridBot {
   }
 
   private async placeInitialOrders(): Promise<void> {
-    const belowPrice: GridLevel[] = [];
-    const abovePrice: GridLevel[] = [];
-
     // Separate levels into buy (below current price) and sell (above current price)
-    for (const level of this.gridLevels) {
-      if (level.price < this.currentPrice) {
-        belowPrice.push(level);
-      } else if (level.price > this.currentPrice) {
-        abovePrice.push(level);
-      }
-    }
+    const belowPrice = this.gridLevels.slice(
+      0,
+      bisectLeft(this.levelPrices, this.currentPrice),
+    );
+    const abovePrice = this.gridLevels.slice(
+      bisectRight(this.levelPrices, this.currentPrice),
+    );
 
     logger.info(
       {
@@ -147,14 +187,18 @@ export class GridBot {
       "Placing initial orders",
     );
 
-    // Place buy orders below current price
-    for (const level of belowPrice) {
-      await this.placeBuyOrder(level);
-    }
-
-    // Place sell orders above current price
-    for (const level of abovePrice) {
-      await this.placeSellOrder(level);
+    // Place buy orders below and sell orders above current price. Orders are
+    // independent, so submit them in batches instead of one round trip each
+    const placements = [
+      ...belowPrice.map((level) => () => this.placeBuyOrder(level)),
+      ...abovePrice.map((level) => () => this.placeSellOrder(level)),
+    ];
+    for (let i = 0; i < placements.length; i += INITIAL_ORDER_BATCH_SIZE) {
+      await Promise.all(
+        placements
+          .slice(i, i + INITIAL_ORDER_BATCH_SIZE)
+          .map((place) => place()),
+      );
     }
   }
 
@@ -163,7 +207,7 @@ export class GridBot {
       "BUY",
       this.gridConfig.amountPerGrid,
       level.price,
-      this.activeOrders.size,
+      this.activeOrders.size + this.pendingOrders,
     );
 
     if (!check.allowed) {
@@ -174,6 +218,7 @@ export class GridBot {
       return;
     }
 
+    this.pendingOrders++;
     try {
       const order = await this.client.placeLimitOrder(
         "BUY",
@@ -184,14 +229,18 @@ export class GridBot {
 
       level.buyOrderId = order.orderId;
       level.status = "buy_pending";
-      this.activeOrders.set(order.orderId, order);
+      this.trackOrder(order);
 
-      logger.debug(
-        { level: level.level, price: level.price, orderId: order.orderId },
-        "Buy order placed",
-      );
+      if (logger.isLevelEnabled("debug")) {
+        logger.debug(
+          { level: level.level, price: level.price, orderId: order.orderId },
+          "Buy order placed",
+        );
+      }
     } catch (error) {
       logger.error({ error, level: level.level }, "Failed to place buy order");
+    } finally {
+      this.pendingOrders--;
     }
   }
 
@@ -200,7 +249,7 @@ export class GridBot {
       "SELL",
       this.gridConfig.amountPerGrid,
       level.price,
-      this.activeOrders.size,
+      this.activeOrders.size + this.pendingOrders,
     );
 
     if (!check.allowed) {
@@ -211,6 +260,7 @@ export class GridBot {
       return;
     }
 
+    this.pendingOrders++;
     try {
       const order = await this.client.placeLimitOrder(
         "SELL",
@@ -221,14 +271,18 @@ export class GridBot {
 
       level.sellOrderId = order.orderId;
       level.status = "sell_pending";
-      this.activeOrders.set(order.orderId, order);
+      this.trackOrder(order);
 
-      logger.debug(
-        { level: level.level, price: level.price, orderId: order.orderId },
-        "Sell order placed",
-      );
+      if (logger.isLevelEnabled("debug")) {
+        logger.debug(
+          { level: level.level, price: level.price, orderId: order.orderId },
+          "Sell order placed",
+        );
+      }
     } catch (error) {
       logger.error({ error, level: level.level }, "Failed to place sell order");
+    } finally {
+      this.pendingOrders--;
     }
   }
 
@@ -259,20 +313,18 @@ export class GridBot {
     if (!existingOrder) return;
 
     // Update stored order
-    this.activeOrders.set(order.orderId, order);
+    this.trackOrder(order);
 
     // Handle filled orders
     if (order.status === "FILLED") {
       await this.handleFilledOrder(order);
     } else if (order.status === "CANCELED" || order.status === "EXPIRED") {
-      this.activeOrders.delete(order.orderId);
+      this.untrackOrder(order.orderId);
     }
   }
 
   private async handleFilledOrder(order: Order): Promise<void> {
-    const level = this.gridLevels.find(
-      (l) => l.buyOrderId === order.orderId || l.sellOrderId === order.orderId,
-    );
+    const level = this.findOrderLevel(order);
 
     if (!level) {
       logger.warn(
@@ -282,7 +334,7 @@ export class GridBot {
       return;
     }
 
-    this.activeOrders.delete(order.orderId);
+    this.untrackOrder(order.orderId);
     this.tradesCount++;
 
     if (order.side === "BUY") {
@@ -296,9 +348,7 @@ export class GridBot {
       level.status = "bought";
 
       // Find next level up for sell order
-      const nextLevel = this.gridLevels.find(
-        (l) => l.level === level.level + 1,
-      );
+      const nextLevel = this.gridLevels[level.level + 1];
       if (nextLevel && !nextLevel.sellOrderId) {
         await this.placeSellOrder(nextLevel);
       }
@@ -317,9 +367,7 @@ export class GridBot {
       level.status = "sold";
 
       // Find next level down for buy order
-      const prevLevel = this.gridLevels.find(
-        (l) => l.level === level.level - 1,
-      );
+      const prevLevel = this.gridLevels[level.level - 1];
       if (prevLevel && !prevLevel.buyOrderId) {
         await this.placeBuyOrder(prevLevel);
       }
@@ -335,44 +383,82 @@ export class GridBot {
     this.riskManager.updateBalance(balance.total);
   }
 
-  getStatus(): {
-    status: BotStatus;
-    currentPrice: number;
-    gridConfig: GridConfig;
-    activeOrdersCount: number;
-    totalPnl: number;
-    tradesCount: number;
-    uptime: number;
-    riskReport: Record<string, unknown>;
-  } {
-    return {
+  /**
+   * Resolve the grid level an order belongs to. Orders carry their level
+   * index, so this is O(1) unless the order id no longer matches it.
+   */
+  private findOrderLevel(order: Order): GridLevel | undefined {
+    const isOwner = (l: GridLevel) =>
+      l.buyOrderId === order.orderId || l.sellOrderId === order.orderId;
+
+    const indexed =
+      order.gridLevel !== undefined
+        ? this.gridLevels[order.gridLevel]
+        : undefined;
+    if (indexed && isOwner(indexed)) return indexed;
+
+    return this.gridLevels.find(isOwner);
+  }
+
+  getStatus(): GridBotStatus {
+    const snapshot = (this.statusSnapshot ??= {
       status: this.status,
-      currentPrice: this.currentPrice,
+      currentPrice: 0,
       gridConfig: this.gridConfig,
-      activeOrdersCount: this.activeOrders.size,
-      totalPnl: this.totalPnl,
-      tradesCount: this.tradesCount,
-      uptime: this.startTime
-        ? Math.floor((Date.now() - this.startTime.getTime()) / 1000)
-        : 0,
-      riskReport: this.riskManager.getRiskReport(),
-    };
+      activeOrdersCount: 0,
+      totalPnl: 0,
+      tradesCount: 0,
+      uptime: 0,
+      riskReport: {},
+    });
+
+    snapshot.status = this.status;
+    snapshot.currentPrice = this.currentPrice;
+    snapshot.activeOrdersCount = this.activeOrders.size;
+    snapshot.totalPnl = this.totalPnl;
+    snapshot.tradesCount = this.tradesCount;
+    snapshot.uptime =
+      this.startedAt !== null
+        ? Math.floor((performance.now() - this.startedAt) / 1000)
+        : 0;
+    snapshot.riskReport = this.riskManager.getRiskReport();
+    return snapshot;
   }
 
-  getGridLevels(): GridLevel[] {
-    return [...this.gridLevels];
+  private trackOrder(order: Order): void {
+    this.activeOrders.set(order.orderId, order);
+    this.activeOrdersSnapshot = null;
+  }
+
+  private untrackOrder(orderId: string): void {
+    if (this.activeOrders.delete(orderId)) {
+      this.activeOrdersSnapshot = null;
+    }
   }
 
-  getActiveOrders(): Order[] {
-    return Array.from(this.activeOrders.values());
+  getGridLevels(): readonly GridLevel[] {
+    // The level array is only replaced, never resized, after initialization
+    return this.gridLevels;
+  }
+
+  /** Active orders, cached until the order set changes */
+  getActiveOrders(): readonly Order[] {
+    return (this.activeOrdersSnapshot ??= Array.from(
+      this.activeOrders.values(),
+    ));
   }
 
   updateConfig(newConfig: Partial<GridConfig>): void {
-    if (this.status === "running") {
+    // Starting/stopping bots are placing or cancelling orders against the
+    // current ladder, so it can only change once the bot is idle
+    if (this.status !== "stopped" && this.status !== "error") {
       throw new Error("Cannot update config while bot is running");
     }
 
     this.gridConfig = { ...this.gridConfig, ...newConfig };
+    this.statusSnapshot = null;
+    // Build the new ladder now so grid reads never compute it
+    this.initializeGridLevels();
     logger.info({ newConfig }, "Grid config updated");
   }
 }
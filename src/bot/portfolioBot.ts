@@ -1,5 +1,7 @@
+import { performance } from "perf_hooks";
 import { createLogger } from "../utils/logger.js";
-import { config } from "../utils/config.js";
+import { toNumber } from "../utils/number.js";
+import { config, computeGridLevels } from "../utils/config.js";
 import { BinanceClient } from "../exchange/binance.js";
 import { binanceStreams, TickerData } from "../exchange/binanceStreams.js";
 import { PortfolioRiskManager } from "./portfolioRisk.js";
@@ -27,10 +29,15 @@ import type { Order, OrderSide } from "../types/index.js";
 
 const logger = createLogger("portfolio-bot");
 
+// Initial grid orders are submitted in concurrent batches of this size
+const INITIAL_ORDER_BATCH_SIZE = 10;
+
 interface PairGridBot {
   config: PairConfig;
   gridLevels: GridLevelState[];
+  gridSpacing: number; // Quote profit per unit per completed grid cycle
   activeOrders: Map<string, Order>;
+  pendingOrders: number; // Orders submitted but not yet acknowledged
   currentPrice: number;
   positionSize: number; // Base asset quantity held
   positionValue: number; // Quote asset value
@@ -66,11 +73,19 @@ export class PortfolioGridBot {
   private status: PortfolioStatus = "stopped";
   private availableCapital: number;
   private allocatedCapital: number = 0;
-  private startTime: Date | null = null;
+  private startTime: Date | null = null; // Wall clock, for display
+  private startedAt: number | null = null; // Monotonic clock, for uptime
   private rebalanceTimer: NodeJS.Timeout | null = null;
   private pricePollingInterval: NodeJS.Timeout | null = null;
   private useWebSocket: boolean = true; // Use WebSocket streams by default
   private wsConnected: boolean = false;
+  private pendingPrices: Map<string, number> = new Map(); // Latest tick per pair
+  private priceFlushTimer: NodeJS.Timeout | null = null;
+  private priceCoalesceMs: number = 10; // Window for batching ticker updates
+  // Simulated order ids: per-session prefix plus a monotonic sequence
+  private readonly simOrderPrefix: string = `SIM_${Date.now().toString(36)}_`;
+  private simOrderSeq: number = 0;
+  private tradeSeq: number = 0;
 
   // Profit Reinvestment Properties
   private initialCapital: number;
@@ -148,6 +163,7 @@ export class PortfolioGridBot {
 
       this.status = "running";
       this.startTime = new Date();
+      this.startedAt = performance.now();
       logger.info("Portfolio bot started successfully");
     } catch (error) {
       this.status = "error";
@@ -178,6 +194,13 @@ export class PortfolioGridBot {
         this.pricePollingInterval = null;
       }
 
+      // Drop any ticker updates still waiting to be processed
+      if (this.priceFlushTimer) {
+        clearTimeout(this.priceFlushTimer);
+        this.priceFlushTimer = null;
+      }
+      this.pendingPrices.clear();
+
       // Stop price simulator if running
       if (config.simulationMode && priceSimulator.getStatus().running) {
         priceSimulator.stop();
@@ -191,8 +214,18 @@ export class PortfolioGridBot {
       }
 
       // Cancel all orders for all pairs
+      const failedPairs: string[] = [];
       for (const [symbol, pairBot] of this.pairBots) {
-        await this.stopPairBot(symbol, pairBot);
+        if (!(await this.stopPairBot(symbol, pairBot))) {
+          failedPairs.push(symbol);
+        }
+      }
+      if (failedPairs.length > 0) {
+        void notificationService.critical(
+          "Orders Left Open",
+          `Portfolio bot stopped but orders could not be cancelled for ${failedPairs.join(", ")}. Cancel them manually.`,
+          { Pairs: failedPairs.join(", ") },
+        );
       }
 
       // Disconnect REST client
@@ -233,7 +266,9 @@ export class PortfolioGridBot {
     const pairBot: PairGridBot = {
       config: { ...config },
       gridLevels,
+      gridSpacing: (config.gridUpper - config.gridLower) / config.gridCount,
       activeOrders: new Map(),
+      pendingOrders: 0,
       currentPrice: 0,
       positionSize: 0,
       positionValue: allocation,
@@ -259,36 +294,22 @@ export class PortfolioGridBot {
   }
 
   private generateGridLevels(config: PairConfig): GridLevelState[] {
-    const levels: GridLevelState[] = [];
     const { gridUpper, gridLower, gridCount, gridType } = config;
+    const prices = computeGridLevels(
+      gridLower,
+      gridUpper,
+      gridCount,
+      gridType,
+    );
 
-    if (gridType === "geometric") {
-      const ratio = Math.pow(gridUpper / gridLower, 1 / gridCount);
-      for (let i = 0; i <= gridCount; i++) {
-        levels.push({
-          level: i,
-          price: gridLower * Math.pow(ratio, i),
-          buyOrderId: null,
-          sellOrderId: null,
-          status: "empty",
-          filledAt: null,
-        });
-      }
-    } else {
-      const spacing = (gridUpper - gridLower) / gridCount;
-      for (let i = 0; i <= gridCount; i++) {
-        levels.push({
-          level: i,
-          price: gridLower + spacing * i,
-          buyOrderId: null,
-          sellOrderId: null,
-          status: "empty",
-          filledAt: null,
-        });
-      }
-    }
-
-    return levels;
+    return prices.map((price, level) => ({
+      level,
+      price,
+      buyOrderId: null,
+      sellOrderId: null,
+      status: "empty" as const,
+      filledAt: null,
+    }));
   }
 
   private async startPairBot(
@@ -314,20 +335,50 @@ export class PortfolioGridBot {
     }
   }
 
+  /**
+   * Cancel the pair's own orders and mark it stopped. Returns false, leaving
+   * the orders still open on the exchange tracked, if any cancellation failed.
+   */
   private async stopPairBot(
     symbol: string,
     pairBot: PairGridBot,
-  ): Promise<void> {
+  ): Promise<boolean> {
     try {
-      // Cancel all active orders for this pair
-      for (const [orderId] of pairBot.activeOrders) {
-        await this.client.cancelOrder(orderId);
+      // Cancel only the orders this bot placed, concurrently. Simulated pair
+      // orders only exist in activeOrders, so clearing it is enough.
+      if (!config.simulationMode) {
+        const orderIds = [...pairBot.activeOrders.keys()];
+        const cancelled = await Promise.all(
+          orderIds.map((orderId) => this.client.cancelOrder(orderId, symbol)),
+        );
+        orderIds.forEach((orderId, i) => {
+          if (cancelled[i]) pairBot.activeOrders.delete(orderId);
+        });
+        if (pairBot.activeOrders.size > 0) {
+          // A failed cancel may be an order that already filled or is unknown
+          // to the exchange; only keep the ones that are still open
+          const open = new Set(
+            (await this.client.getOpenOrders(symbol)).map((o) => o.orderId),
+          );
+          for (const orderId of pairBot.activeOrders.keys()) {
+            if (!open.has(orderId)) pairBot.activeOrders.delete(orderId);
+          }
+        }
+        if (pairBot.activeOrders.size > 0) {
+          logger.error(
+            { symbol, remaining: [...pairBot.activeOrders.keys()] },
+            "Failed to cancel some pair orders, pair not stopped",
+          );
+          return false;
+        }
       }
       pairBot.activeOrders.clear();
       pairBot.status = "stopped";
       logger.info({ symbol }, "Pair bot stopped");
+      return true;
     } catch (error) {
       logger.error({ error, symbol }, "Error stopping pair bot");
+      return false;
     }
   }
 
@@ -362,6 +413,8 @@ export class PortfolioGridBot {
       "Placing initial orders",
     );
 
+    const placements: Array<() => Promise<void>> = [];
+
     // Place buy orders below current price (skip levels that already have orders)
     for (const level of belowPrice) {
       // Skip if this level already has an active buy order
@@ -372,7 +425,7 @@ export class PortfolioGridBot {
         );
         continue;
       }
-      await this.placeBuyOrder(symbol, pairBot, level);
+      placements.push(() => this.placeBuyOrder(symbol, pairBot, level));
     }
 
     // Place sell orders above current price (skip levels that already have orders)
@@ -385,7 +438,17 @@ export class PortfolioGridBot {
         );
         continue;
       }
-      await this.placeSellOrder(symbol, pairBot, level);
+      placements.push(() => this.placeSellOrder(symbol, pairBot, level));
+    }
+
+    // Orders are independent, so submit them in batches instead of one
+    // round trip each
+    for (let i = 0; i < placements.length; i += INITIAL_ORDER_BATCH_SIZE) {
+      await Promise.all(
+        placements
+          .slice(i, i + INITIAL_ORDER_BATCH_SIZE)
+          .map((place) => place()),
+      );
     }
   }
 
@@ -395,7 +458,7 @@ export class PortfolioGridBot {
     level: GridLevelState,
   ): Promise<void> {
     const totalOrders = this.getTotalOpenOrders();
-    const pairOrders = pairBot.activeOrders.size;
+    const pairOrders = pairBot.activeOrders.size + pairBot.pendingOrders;
 
     const check = this.riskManager.canPlaceOrder(
       symbol,
@@ -414,6 +477,7 @@ export class PortfolioGridBot {
       return;
     }
 
+    pairBot.pendingOrders++;
     try {
       const order = await this.placeLimitOrderForSymbol(
         symbol,
@@ -428,21 +492,25 @@ export class PortfolioGridBot {
         level.status = "buy_pending";
         pairBot.activeOrders.set(order.orderId, order);
 
-        logger.debug(
-          {
-            symbol,
-            level: level.level,
-            price: level.price,
-            orderId: order.orderId,
-          },
-          "Buy order placed",
-        );
+        if (logger.isLevelEnabled("debug")) {
+          logger.debug(
+            {
+              symbol,
+              level: level.level,
+              price: level.price,
+              orderId: order.orderId,
+            },
+            "Buy order placed",
+          );
+        }
       }
     } catch (error) {
       logger.error(
         { error, symbol, level: level.level },
         "Failed to place buy order",
       );
+    } finally {
+      pairBot.pendingOrders--;
     }
   }
 
@@ -452,7 +520,7 @@ export class PortfolioGridBot {
     level: GridLevelState,
   ): Promise<void> {
     const totalOrders = this.getTotalOpenOrders();
-    const pairOrders = pairBot.activeOrders.size;
+    const pairOrders = pairBot.activeOrders.size + pairBot.pendingOrders;
 
     const check = this.riskManager.canPlaceOrder(
       symbol,
@@ -471,6 +539,7 @@ export class PortfolioGridBot {
       return;
     }
 
+    pairBot.pendingOrders++;
     try {
       const order = await this.placeLimitOrderForSymbol(
         symbol,
@@ -485,28 +554,32 @@ export class PortfolioGridBot {
         level.status = "sell_pending";
         pairBot.activeOrders.set(order.orderId, order);
 
-        logger.debug(
-          {
-            symbol,
-            level: level.level,
-            price: level.price,
-            orderId: order.orderId,
-          },
-          "Sell order placed",
-        );
+        if (logger.isLevelEnabled("debug")) {
+          logger.debug(
+            {
+              symbol,
+              level: level.level,
+              price: level.price,
+              orderId: order.orderId,
+            },
+            "Sell order placed",
+          );
+        }
       }
     } catch (error) {
       logger.error(
         { error, symbol, level: level.level },
         "Failed to place sell order",
       );
+    } finally {
+      pairBot.pendingOrders--;
     }
   }
 
   private getTotalOpenOrders(): number {
     let total = 0;
     for (const [, pairBot] of this.pairBots) {
-      total += pairBot.activeOrders.size;
+      total += pairBot.activeOrders.size + pairBot.pendingOrders;
     }
     return total;
   }
@@ -554,6 +627,7 @@ export class PortfolioGridBot {
     pairBot.activeOrders.delete(order.orderId);
     pairBot.tradesCount++;
 
+    const filledAt = new Date();
     const orderValue = order.price * order.quantity;
     let realizedPnl = 0;
 
@@ -570,7 +644,7 @@ export class PortfolioGridBot {
 
       level.buyOrderId = null;
       level.status = "bought";
-      level.filledAt = new Date();
+      level.filledAt = filledAt;
 
       // Update position
       pairBot.positionSize += order.quantity;
@@ -599,15 +673,14 @@ export class PortfolioGridBot {
 
       level.sellOrderId = null;
       level.status = "sold";
-      level.filledAt = new Date();
+      level.filledAt = filledAt;
 
       // Update position
       pairBot.positionSize -= order.quantity;
       pairBot.positionValue += orderValue;
 
       // Calculate grid profit (simplified)
-      const gridSpacing = pairBot.config.gridUpper - pairBot.config.gridLower;
-      realizedPnl = (gridSpacing / pairBot.config.gridCount) * order.quantity;
+      realizedPnl = pairBot.gridSpacing * order.quantity;
       pairBot.realizedPnl += realizedPnl;
 
       // Place buy order at next level down
@@ -622,32 +695,34 @@ export class PortfolioGridBot {
       this.riskManager.recordTrade(symbol, orderValue);
     }
 
-    // Persist to database
-    tradingDb.saveTrade({
-      tradeId: `${order.orderId}_${Date.now()}`,
-      orderId: order.orderId,
-      symbol,
-      side: order.side,
-      price: order.price,
-      quantity: order.quantity,
-      realizedPnl,
-      gridLevel: level.level,
-      executedAt: new Date(),
-    });
+    // Persist the trade, grid state and pair state in one commit
+    tradingDb.transaction(() => {
+      tradingDb.saveTrade({
+        tradeId: `${order.orderId}_${++this.tradeSeq}`,
+        orderId: order.orderId,
+        symbol,
+        side: order.side,
+        price: order.price,
+        quantity: order.quantity,
+        realizedPnl,
+        gridLevel: level.level,
+        executedAt: filledAt,
+      });
 
-    // Save updated grid state
-    tradingDb.saveGridState(symbol, pairBot.gridLevels);
+      // Save updated grid state
+      tradingDb.saveGridState(symbol, pairBot.gridLevels);
 
-    // Save pair state
-    tradingDb.savePairState({
-      symbol,
-      status: pairBot.status,
-      currentPrice: pairBot.currentPrice,
-      positionSize: pairBot.positionSize,
-      positionValue: pairBot.positionValue,
-      realizedPnl: pairBot.realizedPnl,
-      unrealizedPnl: pairBot.unrealizedPnl,
-      tradesCount: pairBot.tradesCount,
+      // Save pair state
+      tradingDb.savePairState({
+        symbol,
+        status: pairBot.status,
+        currentPrice: pairBot.currentPrice,
+        positionSize: pairBot.positionSize,
+        positionValue: pairBot.positionValue,
+        realizedPnl: pairBot.realizedPnl,
+        unrealizedPnl: pairBot.unrealizedPnl,
+        tradesCount: pairBot.tradesCount,
+      });
     });
 
     // Update portfolio value
@@ -729,8 +804,7 @@ export class PortfolioGridBot {
   private handleTickerUpdate(ticker: TickerData): void {
     const { symbol, price, priceChangePercent, volume } = ticker;
 
-    // Update price
-    void this.handlePriceUpdate(symbol, price);
+    this.queuePriceUpdate(symbol, price);
 
     // Log significant price changes
     if (Math.abs(priceChangePercent) > 5) {
@@ -741,21 +815,50 @@ export class PortfolioGridBot {
     }
   }
 
+  /**
+   * Keep only the latest price per pair and process them together after a
+   * short window, so bursts of ticks cost one update instead of one each
+   */
+  private queuePriceUpdate(symbol: string, price: number): void {
+    const pairBot = this.pairBots.get(symbol);
+    if (pairBot) pairBot.currentPrice = price;
+    this.pendingPrices.set(symbol, price);
+    if (!this.priceFlushTimer) {
+      this.priceFlushTimer = setTimeout(
+        () => this.flushPendingPrices(),
+        this.priceCoalesceMs,
+      );
+    }
+  }
+
+  /**
+   * Process the latest coalesced ticker price for each pair
+   */
+  private flushPendingPrices(): void {
+    this.priceFlushTimer = null;
+    for (const [symbol, price] of this.pendingPrices) {
+      void this.handlePriceUpdate(symbol, price);
+    }
+    this.pendingPrices.clear();
+  }
+
   /**
    * Start polling-based price updates (fallback or primary if WebSocket unavailable)
    */
   private async startPollingStreams(): Promise<void> {
     logger.info("Starting polling-based price streams (5s interval)");
 
-    // Initial price fetch
-    for (const [symbol] of this.pairBots) {
-      try {
-        const price = await this.fetchPriceForSymbol(symbol);
-        void this.handlePriceUpdate(symbol, price);
-      } catch (error) {
-        logger.error({ error, symbol }, "Failed to fetch initial price");
-      }
-    }
+    // Initial price fetch (all pairs in parallel)
+    await Promise.all(
+      Array.from(this.pairBots.keys(), async (symbol) => {
+        try {
+          const price = await this.fetchPriceForSymbol(symbol);
+          void this.handlePriceUpdate(symbol, price);
+        } catch (error) {
+          logger.error({ error, symbol }, "Failed to fetch initial price");
+        }
+      }),
+    );
 
     // Start polling interval
     this.startPricePolling();
@@ -770,22 +873,27 @@ export class PortfolioGridBot {
 
     // Poll prices every 5 seconds for all pairs
     this.pricePollingInterval = setInterval(() => {
-      void (async () => {
-        logger.debug("Price poll tick");
-        for (const [symbol] of this.pairBots) {
-          try {
-            logger.debug({ symbol }, "Fetching price for symbol");
-            const price = await this.fetchPriceForSymbol(symbol);
-            logger.debug({ symbol, price }, "Price fetched successfully");
-            void this.handlePriceUpdate(symbol, price);
-          } catch (error) {
-            logger.error({ error, symbol }, "Failed to fetch price");
-          }
-        }
-      })();
+      logger.debug("Price poll tick");
+      // Fetch every pair concurrently so one slow request does not delay the
+      // updates for all the others
+      for (const symbol of this.pairBots.keys()) {
+        void this.pollPrice(symbol);
+      }
     }, 5000);
   }
 
+  private async pollPrice(symbol: string): Promise<void> {
+    try {
+      const debug = logger.isLevelEnabled("debug");
+      if (debug) logger.debug({ symbol }, "Fetching price for symbol");
+      const price = await this.fetchPriceForSymbol(symbol);
+      if (debug) logger.debug({ symbol, price }, "Price fetched successfully");
+      void this.handlePriceUpdate(symbol, price);
+    } catch (error) {
+      logger.error({ error, symbol }, "Failed to fetch price");
+    }
+  }
+
   /**
    * Start fallback polling when WebSocket disconnects
    */
@@ -848,9 +956,11 @@ export class PortfolioGridBot {
       }
     }
 
-    // Register callback for price updates
+    // Register callback for price updates. Ticks are queued like live
+    // ticker updates, so the simulator's round returns immediately and the
+    // grid checks run afterwards in one flush
     priceSimulator.onPriceUpdate((symbol: string, price: number) => {
-      void this.handlePriceUpdate(symbol, price);
+      this.queuePriceUpdate(symbol, price);
     });
 
     // Start the simulator
@@ -877,14 +987,16 @@ export class PortfolioGridBot {
 
     // Update unrealized PnL
     if (pairBot.positionSize > 0) {
-      const avgBuyPrice =
-        pairBot.gridLevels
-          .filter((l) => l.status === "bought")
-          .reduce((sum, l) => sum + l.price, 0) /
-        Math.max(
-          1,
-          pairBot.gridLevels.filter((l) => l.status === "bought").length,
-        );
+      // Runs on every tick: one pass over the levels, no filtered copies
+      let boughtSum = 0;
+      let boughtCount = 0;
+      for (const level of pairBot.gridLevels) {
+        if (level.status === "bought") {
+          boughtSum += level.price;
+          boughtCount++;
+        }
+      }
+      const avgBuyPrice = boughtSum / Math.max(1, boughtCount);
 
       pairBot.unrealizedPnl = (price - avgBuyPrice) * pairBot.positionSize;
     }
@@ -1344,7 +1456,7 @@ export class PortfolioGridBot {
     if (Array.isArray(ticker)) {
       throw new Error("Unexpected response");
     }
-    return parseFloat(String(ticker.price));
+    return toNumber(ticker.price);
   }
 
   private async placeLimitOrderForSymbol(
@@ -1364,7 +1476,7 @@ export class PortfolioGridBot {
     // In simulation mode, create a simulated order instead of placing a real one
     if (config.simulationMode) {
       const simulatedOrder: Order = {
-        orderId: `SIM_${symbol}_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`,
+        orderId: `${this.simOrderPrefix}${symbol}_${++this.simOrderSeq}`,
         clientOrderId,
         tradingPair: symbol,
         side,
@@ -1397,8 +1509,8 @@ export class PortfolioGridBot {
         side: side as "BUY" | "SELL",
         type: "LIMIT",
         timeInForce: "GTC",
-        price: roundedPrice,
-        quantity: roundedQuantity,
+        price: this.client.formatPrice(roundedPrice),
+        quantity: this.client.formatQuantity(roundedQuantity),
         newClientOrderId: clientOrderId,
       });
 
@@ -1421,9 +1533,9 @@ export class PortfolioGridBot {
         tradingPair: orderResult.symbol,
         side: orderResult.side as OrderSide,
         orderType: orderResult.type,
-        price: parseFloat(String(orderResult.price)),
-        quantity: parseFloat(String(orderResult.origQty)),
-        filledQuantity: parseFloat(String(orderResult.executedQty)),
+        price: toNumber(orderResult.price),
+        quantity: toNumber(orderResult.origQty),
+        filledQuantity: toNumber(orderResult.executedQty),
         status: orderResult.status as Order["status"],
         gridLevel,
         createdAt: new Date(orderResult.transactTime),
@@ -1593,9 +1705,10 @@ export class PortfolioGridBot {
       pairs: pairStatuses,
       totalPnl,
       totalTrades,
-      uptime: this.startTime
-        ? Math.floor((Date.now() - this.startTime.getTime()) / 1000)
-        : 0,
+      uptime:
+        this.startedAt !== null
+          ? Math.floor((performance.now() - this.startedAt) / 1000)
+          : 0,
       riskStatus: this.riskManager.getStatus(),
       dataFeed: {
         type: this.useWebSocket ? "websocket" : "polling",
@@ -1652,7 +1765,9 @@ export class PortfolioGridBot {
       throw new Error(`Pair ${symbol} not found`);
     }
 
-    await this.stopPairBot(symbol, pairBot);
+    if (!(await this.stopPairBot(symbol, pairBot))) {
+      throw new Error(`Failed to cancel open orders for ${symbol}`);
+    }
 
     // Return allocated capital
     this.availableCapital += pairBot.positionValue;
@@ -1681,8 +1796,10 @@ export class PortfolioGridBot {
       `🛑 EMERGENCY STOP: Stopping ${symbol} - ${reason}`,
     );
 
-    // Cancel all active orders for this pair
-    await this.stopPairBot(symbol, pairBot);
+    // Cancel all active orders for this pair, retrying once on failure
+    const cancelled =
+      (await this.stopPairBot(symbol, pairBot)) ||
+      (await this.stopPairBot(symbol, pairBot));
 
     // Update status to paused
     pairBot.status = "paused";
@@ -1694,19 +1811,29 @@ export class PortfolioGridBot {
     // Send critical alert via notifications
     void notificationService.critical(
       `Emergency Stop: ${symbol}`,
-      `Trading has been emergency stopped for ${symbol} due to ${reason}. All orders have been cancelled.`,
+      cancelled
+        ? `Trading has been emergency stopped for ${symbol} due to ${reason}. All orders have been cancelled.`
+        : `Trading has been emergency stopped for ${symbol} due to ${reason}. ${pairBot.activeOrders.size} orders could not be cancelled and are still open - cancel them manually.`,
       {
         Symbol: symbol,
         Reason: reason,
         Price: pairBot.currentPrice.toString(),
         "Grid Range": `${pairBot.config.gridLower} - ${pairBot.config.gridUpper}`,
+        "Open Orders": pairBot.activeOrders.size,
       },
     );
 
-    logger.info(
-      { symbol, reason },
-      `✅ ${symbol} stopped safely - all orders cancelled`,
-    );
+    if (cancelled) {
+      logger.info(
+        { symbol, reason },
+        `✅ ${symbol} stopped safely - all orders cancelled`,
+      );
+    } else {
+      logger.error(
+        { symbol, reason, openOrders: [...pairBot.activeOrders.keys()] },
+        `${symbol} paused but some orders could not be cancelled`,
+      );
+    }
   }
 
   /**
@@ -1728,7 +1855,7 @@ export class PortfolioGridBot {
     );
 
     // Cancel all active orders but don't remove the pair
-    await this.stopPairBot(symbol, pairBot);
+    const cancelled = await this.stopPairBot(symbol, pairBot);
 
     // Update status to paused
     pairBot.status = "paused";
@@ -1748,12 +1875,16 @@ export class PortfolioGridBot {
     // Send warning alert via notifications
     void notificationService.warning(
       `Trend Pause: ${symbol}`,
-      `Trading paused for ${symbol} due to strong ${trendData.direction}. Auto-resume check scheduled in 1 hour.`,
+      `Trading paused for ${symbol} due to strong ${trendData.direction}. Auto-resume check scheduled in 1 hour.` +
+        (cancelled
+          ? ""
+          : ` ${pairBot.activeOrders.size} orders could not be cancelled and are still open.`),
       {
         Symbol: symbol,
         Trend: trendData.direction.toUpperCase(),
         Strength: trendData.strength.toFixed(2),
         "Auto-Resume": "1 hour",
+        "Open Orders": pairBot.activeOrders.size,
       },
     );
 
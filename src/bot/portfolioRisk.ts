@@ -1,5 +1,6 @@
 import { createLogger } from '../utils/logger.js';
 import { correlationAnalyzer } from '../analysis/correlation.js';
+import { nextDailyReset } from './risk.js';
 import type {
   RiskStrategy,
   RiskLimitsConfig,
@@ -11,13 +12,6 @@ import type {
 
 const logger = createLogger('portfolio-risk');
 
-interface TradeRecord {
-  timestamp: Date;
-  pair: string;
-  pnl: number;
-  type: 'realized' | 'unrealized';
-}
-
 // Reserved for future volatility alert system
 // interface VolatilityAlert {
 //   pair: string;
@@ -40,12 +34,11 @@ interface TradeRecord {
 export class PortfolioRiskManager {
   private limits: RiskLimitsConfig;
   private strategy: RiskStrategy;
-  private tradeHistory: TradeRecord[] = [];
   private dailyPnl = 0;
   private peakPortfolioValue = 0;
   private currentPortfolioValue = 0;
   private consecutiveLosses = 0;
-  private lastResetDate: Date = new Date();
+  private nextResetAt = nextDailyReset();
   // Track volatility alerts (reserved for future alert system)
   // private volatilityAlerts: VolatilityAlert[] = [];
   private isPaused = false;
@@ -144,13 +137,6 @@ export class PortfolioRiskManager {
   recordTrade(pair: string, pnl: number): void {
     this.checkDailyReset();
 
-    this.tradeHistory.push({
-      timestamp: new Date(),
-      pair,
-      pnl,
-      type: 'realized',
-    });
-
     this.dailyPnl += pnl;
 
     // Update pair-specific state
@@ -178,13 +164,12 @@ export class PortfolioRiskManager {
   }
 
   private checkDailyReset(): void {
-    const now = new Date();
-    if (now.toDateString() !== this.lastResetDate.toDateString()) {
+    if (Date.now() >= this.nextResetAt) {
       this.dailyPnl = 0;
       this.pairRiskState.forEach((state) => {
         state.dailyPnl = 0;
       });
-      this.lastResetDate = now;
+      this.nextResetAt = nextDailyReset();
       logger.info('Daily PnL reset');
     }
   }
@@ -4,13 +4,43 @@ import type { GridConfig, RiskLimits, RiskMetrics, OrderSide } from '../types/in
 
 const logger = createLogger('risk');
 
+/** Epoch ms of the next local midnight, when daily metrics roll over */
+export function nextDailyReset(): number {
+  const midnight = new Date();
+  midnight.setHours(24, 0, 0, 0);
+  return midnight.getTime();
+}
+
+export interface OrderCheck {
+  allowed: boolean;
+  reason: string;
+}
+
+type RejectReason =
+  | 'consecutiveLosses'
+  | 'openOrders'
+  | 'drawdown'
+  | 'dailyLoss'
+  | 'positionSize';
+
+const ORDER_ALLOWED: OrderCheck = Object.freeze({
+  allowed: true,
+  reason: 'OK',
+});
+
 export class RiskManager {
   private limits: RiskLimits;
+  // Every canPlaceOrder outcome depends only on the fixed limits, so the
+  // results are built once and shared instead of formatted per check
+  private readonly rejections: Record<RejectReason, OrderCheck>;
   private metrics: RiskMetrics;
-  private dailyTrades: number[] = [];
   private peakBalance = 0;
-  private currentBalance = 0;
-  private lastReset: Date = new Date();
+  private maxPositionValue = 0; // maxPositionSize * current balance
+  private nextResetAt = nextDailyReset();
+  // Stop-loss/take-profit prices, derived from thresholdConfig on first use
+  private thresholdConfig: GridConfig | null = null;
+  private stopLossPrice = 0;
+  private takeProfitPrice = Infinity;
 
   constructor(limits?: Partial<RiskLimits>) {
     this.limits = {
@@ -23,6 +53,22 @@ export class RiskManager {
       maxDrawdownPercent: limits?.maxDrawdownPercent ?? 10,
     };
 
+    const reject = (reason: string): OrderCheck =>
+      Object.freeze({ allowed: false, reason });
+    this.rejections = {
+      consecutiveLosses: reject(
+        `Max consecutive losses (${this.limits.maxConsecutiveLosses}) reached`
+      ),
+      openOrders: reject(
+        `Max open orders (${this.limits.maxOpenOrders}) reached`
+      ),
+      drawdown: reject(
+        `Max drawdown (${this.limits.maxDrawdownPercent}%) reached`
+      ),
+      dailyLoss: reject('Daily loss limit reached'),
+      positionSize: reject('Order exceeds max position size'),
+    };
+
     this.metrics = {
       totalExposure: 0,
       dailyPnl: 0,
@@ -35,7 +81,7 @@ export class RiskManager {
   }
 
   updateBalance(balance: number): void {
-    this.currentBalance = balance;
+    this.maxPositionValue = this.limits.maxPositionSize * balance;
 
     if (balance > this.peakBalance) {
       this.peakBalance = balance;
@@ -52,8 +98,7 @@ export class RiskManager {
   }
 
   recordTradePnl(pnl: number): void {
-    this.dailyTrades.push(pnl);
-    this.metrics.dailyPnl = this.dailyTrades.reduce((sum, p) => sum + p, 0);
+    this.metrics.dailyPnl += pnl;
 
     if (pnl < 0) {
       this.metrics.consecutiveLosses++;
@@ -67,48 +112,43 @@ export class RiskManager {
     quantity: number,
     price: number,
     currentOpenOrders: number
-  ): { allowed: boolean; reason: string } {
-    // Check daily loss limit
-    if (this.metrics.dailyPnl <= -this.limits.dailyLossLimit) {
-      return { allowed: false, reason: 'Daily loss limit reached' };
+  ): OrderCheck {
+    // Cheapest checks first; the position size check multiplies last
+    const metrics = this.metrics;
+    const limits = this.limits;
+    const rejections = this.rejections;
+
+    // Check consecutive losses
+    if (metrics.consecutiveLosses >= limits.maxConsecutiveLosses) {
+      return rejections.consecutiveLosses;
     }
 
     // Check max open orders
-    if (currentOpenOrders >= this.limits.maxOpenOrders) {
-      return {
-        allowed: false,
-        reason: `Max open orders (${this.limits.maxOpenOrders}) reached`,
-      };
+    if (currentOpenOrders >= limits.maxOpenOrders) {
+      return rejections.openOrders;
     }
 
-    // Check position size
-    const orderValue = quantity * price;
-    if (orderValue > this.limits.maxPositionSize * this.currentBalance) {
-      return { allowed: false, reason: 'Order exceeds max position size' };
+    // Check drawdown
+    if (metrics.drawdown >= limits.maxDrawdownPercent) {
+      return rejections.drawdown;
     }
 
-    // Check consecutive losses
-    if (this.metrics.consecutiveLosses >= this.limits.maxConsecutiveLosses) {
-      return {
-        allowed: false,
-        reason: `Max consecutive losses (${this.limits.maxConsecutiveLosses}) reached`,
-      };
+    // Check daily loss limit
+    if (metrics.dailyPnl <= -limits.dailyLossLimit) {
+      return rejections.dailyLoss;
     }
 
-    // Check drawdown
-    if (this.metrics.drawdown >= this.limits.maxDrawdownPercent) {
-      return {
-        allowed: false,
-        reason: `Max drawdown (${this.limits.maxDrawdownPercent}%) reached`,
-      };
+    // Check position size
+    if (quantity * price > this.maxPositionValue) {
+      return rejections.positionSize;
     }
 
-    return { allowed: true, reason: 'OK' };
+    return ORDER_ALLOWED;
   }
 
   checkStopLoss(currentPrice: number, gridConfig: GridConfig): boolean {
-    const stopLossPrice =
-      gridConfig.lowerPrice * (1 - this.limits.stopLossPercent / 100);
+    this.bindGridConfig(gridConfig);
+    const stopLossPrice = this.stopLossPrice;
 
     if (currentPrice <= stopLossPrice) {
       this.metrics.stopLossTriggered = true;
@@ -123,8 +163,8 @@ export class RiskManager {
   }
 
   checkTakeProfit(currentPrice: number, gridConfig: GridConfig): boolean {
-    const takeProfitPrice =
-      gridConfig.upperPrice * (1 + this.limits.takeProfitPercent / 100);
+    this.bindGridConfig(gridConfig);
+    const takeProfitPrice = this.takeProfitPrice;
 
     if (currentPrice >= takeProfitPrice) {
       this.metrics.takeProfitTriggered = true;
@@ -138,18 +178,30 @@ export class RiskManager {
     return false;
   }
 
+  /**
+   * Recompute the exit thresholds only when a different grid config is
+   * passed in; bots keep the same config object while running
+   */
+  private bindGridConfig(gridConfig: GridConfig): void {
+    if (gridConfig === this.thresholdConfig) return;
+
+    this.thresholdConfig = gridConfig;
+    this.stopLossPrice =
+      gridConfig.lowerPrice * (1 - this.limits.stopLossPercent / 100);
+    this.takeProfitPrice =
+      gridConfig.upperPrice * (1 + this.limits.takeProfitPercent / 100);
+  }
+
   resetDailyMetrics(): void {
-    this.dailyTrades = [];
     this.metrics.dailyPnl = 0;
     this.metrics.stopLossTriggered = false;
     this.metrics.takeProfitTriggered = false;
-    this.lastReset = new Date();
+    this.nextResetAt = nextDailyReset();
     logger.info('Daily metrics reset');
   }
 
   shouldResetDaily(): boolean {
-    const now = new Date();
-    return now.toDateString() !== this.lastReset.toDateString();
+    return Date.now() >= this.nextResetAt;
   }
 
   getRiskReport(): Record<string, unknown> {
@@ -1,6 +1,16 @@
+import { performance } from "perf_hooks";
 import Binance from "binance";
 import { config } from "../utils/config.js";
 import { createLogger } from "../utils/logger.js";
+import { toNumber } from "../utils/number.js";
+import { parseGridLevel } from "../utils/orderId.js";
+import {
+  floorToTick,
+  formatTick,
+  parseTickSize,
+  type TickSize,
+} from "../utils/ticks.js";
+import { binanceHttpsAgent } from "./httpAgent.js";
 import type {
   Order,
   OrderSide,
@@ -14,11 +24,120 @@ const logger = createLogger("binance");
 type PriceCallback = (price: number) => void;
 type OrderCallback = (order: Order) => void;
 
+// Raw stream payloads, using Binance's short field names. Only the fields
+// read by the handlers are declared.
+interface RawMiniTickerEvent {
+  e: "24hrMiniTicker";
+  c: string; // Close price
+}
+
+interface RawExecutionReportEvent {
+  e: "executionReport";
+  E: number; // Event time
+  s: string; // Symbol
+  c: string; // Client order id
+  S: string; // Side
+  o: string; // Order type
+  p: string; // Price
+  q: string; // Quantity
+  l: string; // Last filled quantity
+  X: string; // Order status
+  i: number; // Order id
+}
+
+interface RawAccountPositionEvent {
+  e: "outboundAccountPosition";
+  B: Array<{ a: string; f: string; l: string }>; // Changed balances
+}
+
+type RawStreamEvent =
+  | RawMiniTickerEvent
+  | RawExecutionReportEvent
+  | RawAccountPositionEvent
+  | { e?: undefined };
+
+// Live balances are reused for this long before hitting /api/v3/account again
+const BALANCE_CACHE_TTL_MS = 1000;
+
+// Recent trades (myTrades is a weight-20 request) are reused for this long,
+// or until the user stream reports a fill
+const TRADES_CACHE_TTL_MS = 2000;
+
 // Simulated order for tracking in simulation mode
 interface SimulatedOrder extends Order {
   isSimulated: true;
 }
 
+interface PriceHeapEntry {
+  price: number;
+  orderId: string;
+}
+
+/**
+ * Binary heap of resting simulated orders keyed by price.
+ * `before(a, b)` returns true when `a` should sit closer to the top than `b`.
+ */
+class OrderPriceHeap {
+  private entries: PriceHeapEntry[] = [];
+
+  constructor(private before: (a: number, b: number) => boolean) {}
+
+  get size(): number {
+    return this.entries.length;
+  }
+
+  peek(): PriceHeapEntry | undefined {
+    return this.entries[0];
+  }
+
+  push(entry: PriceHeapEntry): void {
+    const entries = this.entries;
+    entries.push(entry);
+    let i = entries.length - 1;
+    while (i > 0) {
+      const parent = (i - 1) >> 1;
+      if (!this.before(entries[i].price, entries[parent].price)) break;
+      [entries[i], entries[parent]] = [entries[parent], entries[i]];
+      i = parent;
+    }
+  }
+
+  pop(): PriceHeapEntry | undefined {
+    const entries = this.entries;
+    const top = entries[0];
+    const last = entries.pop();
+    if (entries.length === 0 || !last) return top;
+
+    entries[0] = last;
+    let i = 0;
+    for (;;) {
+      const left = 2 * i + 1;
+      const right = left + 1;
+      let next = i;
+      if (
+        left < entries.length &&
+        this.before(entries[left].price, entries[next].price)
+      ) {
+        next = left;
+      }
+      if (
+        right < entries.length &&
+        this.before(entries[right].price, entries[next].price)
+      ) {
+        next = right;
+      }
+      if (next === i) break;
+      [entries[i], entries[next]] = [entries[next], entries[i]];
+      i = next;
+    }
+    return top;
+  }
+
+  clear(): void {
+    this.entries = [];
+  }
+}
+
 export class BinanceClient {
   private client: Binance.MainClient | null = null;
   private wsClient: Binance.WebsocketClient | null = null;
@@ -26,16 +145,61 @@ export class BinanceClient {
     tickSize?: number;
     stepSize?: number;
     minNotional?: number;
+    // Integer-unit forms of tickSize/stepSize used for rounding
+    priceTick?: TickSize;
+    quantityStep?: TickSize;
   } = {};
+  // Copy-on-write: registering replaces the array, so dispatch loops
+  // iterate a stable snapshot even if a callback registers another
   private priceCallbacks: PriceCallback[] = [];
   private orderCallbacks: OrderCallback[] = [];
+  // Price callbacks run on a later turn with the latest price, so a slow
+  // consumer never holds up frame handling and bursts collapse to one call
+  private priceDispatchScheduled = false;
+  private readonly dispatchPrice = (): void => {
+    this.priceDispatchScheduled = false;
+    if (!this.wsClient) return; // Disconnected while queued
+
+    const price = this._lastPrice;
+    for (const callback of this.priceCallbacks) {
+      callback(price);
+    }
+  };
   private isConnected = false;
 
+  // Live account balances (fetchedAt is a monotonic timestamp, ms)
+  private balanceCache: { fetchedAt: number; balances: Balance[] } | null =
+    null;
+  private balanceRequest: Promise<Balance[]> | null = null;
+  private tradesCache: {
+    fetchedAt: number;
+    limit: number;
+    request: Promise<Trade[]>;
+  } | null = null;
+
   // Simulation state
+  // Resting (NEW) simulated orders only; fills move to simulatedFills
   private simulatedOrders: Map<string, SimulatedOrder> = new Map();
+  private simulatedFills: SimulatedOrder[] = [];
+  // Resting orders by fill priority: highest BUY first, lowest SELL first.
+  // Entries are removed lazily, so ids may refer to cancelled orders.
+  private simulatedBuys = new OrderPriceHeap((a, b) => a > b);
+  private simulatedSells = new OrderPriceHeap((a, b) => a < b);
   private simulatedOrderIdCounter = 1000000;
   private simulatedBalances: Map<string, Balance> = new Map();
+  // Same objects as simulatedBalances (updated in place), kept as an array so
+  // balance reads don't rebuild one from the map on every request
+  private simulatedBalanceList: Balance[] = [];
   private _lastPrice = 0;
+  // Pair settings are fixed for the client's lifetime, so resolve them once
+  private readonly tradingPair = config.tradingPair;
+  private readonly baseAsset = config.baseAsset || "DOGE";
+  private readonly quoteAsset = config.quoteAsset || "USDT";
+  // Use POST_ONLY (GTX) for maker-only orders (lower fees)
+  // Falls back to GTC if POST_ONLY is disabled
+  private readonly timeInForce: "GTC" | "GTX" = config.postOnlyOrders
+    ? "GTX"
+    : "GTC";
 
   /** Get the last known price */
   get lastPrice(): number {
@@ -51,11 +215,14 @@ export class BinanceClient {
         baseUrl = "https://api.binance.us";
       }
 
-      this.client = new Binance.MainClient({
-        api_key: config.binanceApiKey,
-        api_secret: config.binanceApiSecret,
-        baseUrl,
-      });
+      this.client = new Binance.MainClient(
+        {
+          api_key: config.binanceApiKey,
+          api_secret: config.binanceApiSecret,
+          baseUrl,
+        },
+        { httpsAgent: binanceHttpsAgent },
+      );
 
       // Load symbol info
       await this.loadSymbolInfo();
@@ -85,8 +252,7 @@ export class BinanceClient {
 
   private initializeSimulatedBalances(): void {
     // Initialize with configured capital
-    const quoteAsset = config.quoteAsset || "USDT";
-    const baseAsset = config.baseAsset || "DOGE";
+    const { quoteAsset, baseAsset } = this;
 
     this.simulatedBalances.set(quoteAsset, {
       asset: quoteAsset,
@@ -101,6 +267,7 @@ export class BinanceClient {
       locked: 0,
       total: 0,
     });
+    this.simulatedBalanceList = Array.from(this.simulatedBalances.values());
 
     logger.info(
       { quoteAsset, capital: config.totalCapital },
@@ -114,6 +281,8 @@ export class BinanceClient {
       this.wsClient = null;
     }
     this.isConnected = false;
+    this.balanceCache = null;
+    this.tradesCache = null;
     logger.info("Disconnected from Binance");
   }
 
@@ -123,19 +292,19 @@ export class BinanceClient {
     try {
       const exchangeInfo = await this.client.getExchangeInfo();
       const symbolData = exchangeInfo.symbols.find(
-        (s) => s.symbol === config.tradingPair,
+        (s) => s.symbol === this.tradingPair,
       );
 
       if (symbolData) {
         for (const filter of symbolData.filters) {
           if (filter.filterType === "PRICE_FILTER") {
-            this.symbolInfo.tickSize = parseFloat(
-              String((filter as { tickSize: string }).tickSize),
-            );
+            const tickSize = String((filter as { tickSize: string }).tickSize);
+            this.symbolInfo.tickSize = parseFloat(tickSize);
+            this.symbolInfo.priceTick = parseTickSize(tickSize);
           } else if (filter.filterType === "LOT_SIZE") {
-            this.symbolInfo.stepSize = parseFloat(
-              String((filter as { stepSize: string }).stepSize),
-            );
+            const stepSize = String((filter as { stepSize: string }).stepSize);
+            this.symbolInfo.stepSize = parseFloat(stepSize);
+            this.symbolInfo.quantityStep = parseTickSize(stepSize);
           } else if (filter.filterType === "NOTIONAL") {
             this.symbolInfo.minNotional = parseFloat(
               String((filter as { minNotional: string }).minNotional),
@@ -150,31 +319,39 @@ export class BinanceClient {
   }
 
   roundPrice(price: number): number {
-    if (!this.symbolInfo.tickSize) return price;
-    return (
-      Math.floor(price / this.symbolInfo.tickSize) * this.symbolInfo.tickSize
-    );
+    const tick = this.symbolInfo.priceTick;
+    return tick ? floorToTick(price, tick) : price;
   }
 
   roundQuantity(quantity: number): number {
-    if (!this.symbolInfo.stepSize) return quantity;
-    return (
-      Math.floor(quantity / this.symbolInfo.stepSize) * this.symbolInfo.stepSize
-    );
+    const step = this.symbolInfo.quantityStep;
+    return step ? floorToTick(quantity, step) : quantity;
+  }
+
+  /** Order parameter string for a rounded price, at the tick's precision */
+  formatPrice(price: number): string {
+    const tick = this.symbolInfo.priceTick;
+    return tick ? formatTick(price, tick) : String(price);
+  }
+
+  /** Order parameter string for a rounded quantity, at the step's precision */
+  formatQuantity(quantity: number): string {
+    const step = this.symbolInfo.quantityStep;
+    return step ? formatTick(quantity, step) : String(quantity);
   }
 
   async getCurrentPrice(): Promise<number> {
     if (!this.client) throw new Error("Client not connected");
 
     const ticker = await this.client.getSymbolPriceTicker({
-      symbol: config.tradingPair,
+      symbol: this.tradingPair,
     });
 
     if (Array.isArray(ticker)) {
       throw new Error("Unexpected response from Binance");
     }
 
-    return parseFloat(String(ticker.price));
+    return toNumber(ticker.price);
   }
 
   async getBalances(): Promise<Balance[]> {
@@ -182,26 +359,72 @@ export class BinanceClient {
 
     // Return simulated balances in simulation mode
     if (config.simulationMode) {
-      return Array.from(this.simulatedBalances.values()).filter(
-        (b) => b.total > 0,
-      );
+      return this.simulatedBalanceList.filter((b) => b.total > 0);
     }
 
+    const cached = this.balanceCache;
+    if (
+      cached &&
+      performance.now() - cached.fetchedAt < BALANCE_CACHE_TTL_MS
+    ) {
+      return cached.balances;
+    }
+
+    // Concurrent callers share a single account request
+    this.balanceRequest ??= this.fetchBalances().finally(() => {
+      this.balanceRequest = null;
+    });
+    return this.balanceRequest;
+  }
+
+  private async fetchBalances(): Promise<Balance[]> {
+    if (!this.client) throw new Error("Client not connected");
+
     const account = await this.client.getAccountInformation();
-    return account.balances
-      .filter(
-        (b) =>
-          parseFloat(String(b.free)) > 0 || parseFloat(String(b.locked)) > 0,
-      )
-      .map((b) => ({
-        asset: b.asset,
-        free: parseFloat(String(b.free)),
-        locked: parseFloat(String(b.locked)),
-        total: parseFloat(String(b.free)) + parseFloat(String(b.locked)),
-      }));
+    // Single pass: most account entries are zero, and each field is parsed
+    // once rather than once per filter/map step
+    const balances: Balance[] = [];
+    for (const b of account.balances) {
+      const free = toNumber(b.free);
+      const locked = toNumber(b.locked);
+      if (free > 0 || locked > 0) {
+        balances.push({ asset: b.asset, free, locked, total: free + locked });
+      }
+    }
+
+    this.balanceCache = { fetchedAt: performance.now(), balances };
+    return balances;
+  }
+
+  /**
+   * Apply a pushed account update to the cached balances so they stay fresh
+   * without another REST call
+   */
+  private applyAccountPosition(event: RawAccountPositionEvent): void {
+    const cached = this.balanceCache;
+    if (!cached) return;
+
+    const byAsset = new Map(cached.balances.map((b) => [b.asset, b]));
+    for (const { a: asset, f, l } of event.B) {
+      const free = parseFloat(f);
+      const locked = parseFloat(l);
+      byAsset.set(asset, { asset, free, locked, total: free + locked });
+    }
+
+    this.balanceCache = {
+      fetchedAt: performance.now(),
+      balances: Array.from(byAsset.values()).filter((b) => b.total > 0),
+    };
   }
 
   async getBalance(asset: string): Promise<Balance> {
+    // Called on every fill; avoid copying the whole balance map in simulation
+    if (config.simulationMode && this.client) {
+      const simulated = this.simulatedBalances.get(asset);
+      if (simulated && simulated.total > 0) return simulated;
+      return { asset, free: 0, locked: 0, total: 0 };
+    }
+
     const balances = await this.getBalances();
     const balance = balances.find((b) => b.asset === asset);
     return balance || { asset, free: 0, locked: 0, total: 0 };
@@ -240,18 +463,13 @@ export class BinanceClient {
     }
 
     try {
-      // Use POST_ONLY (GTX) for maker-only orders (lower fees)
-      // Falls back to GTC if POST_ONLY is disabled
-      const usePostOnly = process.env.POST_ONLY_ORDERS === "true";
-      const timeInForce = usePostOnly ? "GTX" : "GTC";
-
       const result = await this.client.submitNewOrder({
-        symbol: config.tradingPair,
+        symbol: this.tradingPair,
         side: side as "BUY" | "SELL",
         type: "LIMIT",
-        timeInForce: timeInForce as "GTC" | "GTX",
-        price: roundedPrice,
-        quantity: roundedQuantity,
+        timeInForce: this.timeInForce,
+        price: this.formatPrice(roundedPrice),
+        quantity: this.formatQuantity(roundedQuantity),
         newClientOrderId: clientOrderId,
       });
 
@@ -275,9 +493,9 @@ export class BinanceClient {
         tradingPair: orderResult.symbol,
         side: orderResult.side as OrderSide,
         orderType: orderResult.type,
-        price: parseFloat(String(orderResult.price)),
-        quantity: parseFloat(String(orderResult.origQty)),
-        filledQuantity: parseFloat(String(orderResult.executedQty)),
+        price: toNumber(orderResult.price),
+        quantity: toNumber(orderResult.origQty),
+        filledQuantity: toNumber(orderResult.executedQty),
         status: orderResult.status as OrderStatus,
         gridLevel,
         createdAt: new Date(orderResult.transactTime),
@@ -310,10 +528,8 @@ export class BinanceClient {
     const orderId = `SIM_${this.simulatedOrderIdCounter++}`;
 
     // Lock funds for the order
-    const quoteAsset = config.quoteAsset || "USDT";
-    const baseAsset = config.baseAsset || "DOGE";
-    const quoteBalance = this.simulatedBalances.get(quoteAsset);
-    const baseBalance = this.simulatedBalances.get(baseAsset);
+    const quoteBalance = this.simulatedBalances.get(this.quoteAsset);
+    const baseBalance = this.simulatedBalances.get(this.baseAsset);
 
     if (side === "BUY") {
       const cost = price * quantity;
@@ -336,7 +552,7 @@ export class BinanceClient {
     const order: SimulatedOrder = {
       orderId,
       clientOrderId: clientOrderId || `sim_${Date.now()}`,
-      tradingPair: config.tradingPair,
+      tradingPair: this.tradingPair,
       side,
       orderType: "LIMIT",
       price,
@@ -349,6 +565,10 @@ export class BinanceClient {
     };
 
     this.simulatedOrders.set(orderId, order);
+    (side === "BUY" ? this.simulatedBuys : this.simulatedSells).push({
+      price,
+      orderId,
+    });
 
     logger.info(
       { orderId, side, price, quantity, gridLevel, simulated: true },
@@ -358,7 +578,10 @@ export class BinanceClient {
     return order;
   }
 
-  async cancelOrder(orderId: string): Promise<boolean> {
+  async cancelOrder(
+    orderId: string,
+    symbol: string = this.tradingPair,
+  ): Promise<boolean> {
     if (!this.client) throw new Error("Client not connected");
 
     // SIMULATION MODE: Cancel simulated order
@@ -368,13 +591,13 @@ export class BinanceClient {
 
     try {
       await this.client.cancelOrder({
-        symbol: config.tradingPair,
+        symbol,
         orderId: parseInt(orderId, 10),
       });
-      logger.info({ orderId }, "Order cancelled");
+      logger.info({ orderId, symbol }, "Order cancelled");
       return true;
     } catch (error) {
-      logger.error({ error, orderId }, "Failed to cancel order");
+      logger.error({ error, orderId, symbol }, "Failed to cancel order");
       return false;
     }
   }
@@ -384,10 +607,8 @@ export class BinanceClient {
     if (!order) return false;
 
     // Unlock funds
-    const quoteAsset = config.quoteAsset || "USDT";
-    const baseAsset = config.baseAsset || "DOGE";
-    const quoteBalance = this.simulatedBalances.get(quoteAsset);
-    const baseBalance = this.simulatedBalances.get(baseAsset);
+    const quoteBalance = this.simulatedBalances.get(this.quoteAsset);
+    const baseBalance = this.simulatedBalances.get(this.baseAsset);
 
     if (order.side === "BUY" && quoteBalance) {
       const cost = order.price * order.quantity;
@@ -412,6 +633,8 @@ export class BinanceClient {
       for (const orderId of this.simulatedOrders.keys()) {
         this.cancelSimulatedOrder(orderId);
       }
+      this.simulatedBuys.clear();
+      this.simulatedSells.clear();
       logger.info(
         { count, simulated: true },
         "[SIMULATION] All orders cancelled",
@@ -421,7 +644,7 @@ export class BinanceClient {
 
     try {
       const result = await this.client.cancelAllSymbolOrders({
-        symbol: config.tradingPair,
+        symbol: this.tradingPair,
       });
       const count = Array.isArray(result) ? result.length : 0;
       logger.info({ count }, "All orders cancelled");
@@ -432,19 +655,15 @@ export class BinanceClient {
     }
   }
 
-  async getOpenOrders(): Promise<Order[]> {
+  async getOpenOrders(symbol: string = this.tradingPair): Promise<Order[]> {
     if (!this.client) throw new Error("Client not connected");
 
     // SIMULATION MODE: Return simulated open orders
     if (config.simulationMode) {
-      return Array.from(this.simulatedOrders.values()).filter(
-        (o) => o.status === "NEW" || o.status === "PARTIALLY_FILLED",
-      );
+      return Array.from(this.simulatedOrders.values());
     }
 
-    const orders = await this.client.getOpenOrders({
-      symbol: config.tradingPair,
-    });
+    const orders = await this.client.getOpenOrders({ symbol });
 
     return orders.map((o) => ({
       orderId: o.orderId.toString(),
@@ -452,11 +671,11 @@ export class BinanceClient {
       tradingPair: o.symbol,
       side: o.side as OrderSide,
       orderType: o.type,
-      price: parseFloat(String(o.price)),
-      quantity: parseFloat(String(o.origQty)),
-      filledQuantity: parseFloat(String(o.executedQty)),
+      price: toNumber(o.price),
+      quantity: toNumber(o.origQty),
+      filledQuantity: toNumber(o.executedQty),
       status: o.status as OrderStatus,
-      gridLevel: this.extractGridLevel(o.clientOrderId),
+      gridLevel: parseGridLevel(o.clientOrderId),
       createdAt: new Date(o.time),
     }));
   }
@@ -464,8 +683,30 @@ export class BinanceClient {
   async getRecentTrades(limit = 50): Promise<Trade[]> {
     if (!this.client) throw new Error("Client not connected");
 
+    // Polls within the TTL (including concurrent ones) share one request
+    const cached = this.tradesCache;
+    if (
+      cached &&
+      cached.limit === limit &&
+      performance.now() - cached.fetchedAt < TRADES_CACHE_TTL_MS
+    ) {
+      return cached.request;
+    }
+
+    const request = this.fetchRecentTrades(limit);
+    const entry = { fetchedAt: performance.now(), limit, request };
+    this.tradesCache = entry;
+    void request.catch(() => {
+      if (this.tradesCache === entry) this.tradesCache = null;
+    });
+    return request;
+  }
+
+  private async fetchRecentTrades(limit: number): Promise<Trade[]> {
+    if (!this.client) throw new Error("Client not connected");
+
     const trades = await this.client.getAccountTradeList({
-      symbol: config.tradingPair,
+      symbol: this.tradingPair,
       limit,
     });
 
@@ -474,32 +715,29 @@ export class BinanceClient {
       orderId: t.orderId.toString(),
       tradingPair: t.symbol,
       side: t.isBuyer ? ("BUY" as OrderSide) : ("SELL" as OrderSide),
-      price: parseFloat(String(t.price)),
-      quantity: parseFloat(String(t.qty)),
-      commission: parseFloat(String(t.commission)),
+      price: toNumber(t.price),
+      quantity: toNumber(t.qty),
+      commission: toNumber(t.commission),
       commissionAsset: t.commissionAsset,
       realizedPnl: 0,
       createdAt: new Date(t.time),
     }));
   }
 
-  private extractGridLevel(clientOrderId: string): number | undefined {
-    if (clientOrderId?.startsWith("grid_")) {
-      const parts = clientOrderId.split("_");
-      if (parts.length >= 2) {
-        const level = parseInt(parts[1], 10);
-        if (!isNaN(level)) return level;
-      }
-    }
-    return undefined;
-  }
-
   onPriceUpdate(callback: PriceCallback): void {
-    this.priceCallbacks.push(callback);
+    this.priceCallbacks = [...this.priceCallbacks, callback];
   }
 
   onOrderUpdate(callback: OrderCallback): void {
-    this.orderCallbacks.push(callback);
+    this.orderCallbacks = [...this.orderCallbacks, callback];
+  }
+
+  offPriceUpdate(callback: PriceCallback): void {
+    this.priceCallbacks = this.priceCallbacks.filter((cb) => cb !== callback);
+  }
+
+  offOrderUpdate(callback: OrderCallback): void {
+    this.orderCallbacks = this.orderCallbacks.filter((cb) => cb !== callback);
   }
 
   startPriceStream(): void {
@@ -513,23 +751,27 @@ export class BinanceClient {
     this.wsClient = new Binance.WebsocketClient({
       api_key: config.binanceApiKey,
       api_secret: config.binanceApiSecret,
-      beautify: true,
+      // Handlers read the raw short-key payloads, so skip the per-message
+      // beautify pass that copies every frame into a renamed object
+      beautify: false,
       wsUrl: wsBaseUrl,
     });
 
-    this.wsClient.on("formattedMessage", (data: unknown) => {
-      const msg = data as { eventType?: string; close?: string };
-      if (msg.eventType === "24hrTicker" && msg.close) {
-        const price = parseFloat(msg.close);
+    this.wsClient.on("message", (data: unknown) => {
+      const msg = data as RawStreamEvent;
+      if (msg.e === "24hrMiniTicker" && msg.c) {
+        const price = parseFloat(msg.c);
         this._lastPrice = price;
 
-        // In simulation mode, check if any orders should be filled
+        // In simulation mode, check if any orders should be filled. This
+        // stays per frame so a brief touch of an order's price still fills.
         if (config.simulationMode) {
           this.checkSimulatedOrderFills(price);
         }
 
-        for (const callback of this.priceCallbacks) {
-          callback(price);
+        if (!this.priceDispatchScheduled) {
+          this.priceDispatchScheduled = true;
+          setImmediate(this.dispatchPrice);
         }
       }
     });
@@ -538,43 +780,43 @@ export class BinanceClient {
       logger.error({ error }, "WebSocket error");
     });
 
-    this.wsClient.subscribeSpotSymbol24hrTicker(config.tradingPair);
+    // Only the close price is used, so take the mini ticker: a fraction of
+    // the full ticker's fields to receive and parse per frame
+    this.wsClient.subscribeSpotSymbolMini24hrTicker(this.tradingPair);
     logger.info("Price stream started");
   }
 
   startUserStream(): void {
     if (!this.wsClient) return;
 
-    this.wsClient.on("formattedUserDataMessage", (data: unknown) => {
-      const msg = data as {
-        eventType?: string;
-        orderId?: number;
-        newClientOrderId?: string;
-        symbol?: string;
-        side?: string;
-        orderType?: string;
-        price?: string;
-        quantity?: string;
-        lastFilledQuantity?: string;
-        orderStatus?: string;
-        eventTime?: number;
-      };
+    this.wsClient.on("message", (data: unknown) => {
+      const msg = data as RawStreamEvent;
+
+      if (msg.e === "outboundAccountPosition") {
+        this.applyAccountPosition(msg);
+        return;
+      }
 
-      if (msg.eventType === "executionReport") {
+      if (msg.e === "executionReport") {
         const order: Order = {
-          orderId: String(msg.orderId || ""),
-          clientOrderId: msg.newClientOrderId,
-          tradingPair: msg.symbol || "",
-          side: (msg.side as OrderSide) || "BUY",
-          orderType: msg.orderType || "LIMIT",
-          price: parseFloat(msg.price || "0"),
-          quantity: parseFloat(msg.quantity || "0"),
-          filledQuantity: parseFloat(msg.lastFilledQuantity || "0"),
-          status: (msg.orderStatus as OrderStatus) || "NEW",
-          gridLevel: this.extractGridLevel(msg.newClientOrderId || ""),
-          createdAt: new Date(msg.eventTime || Date.now()),
+          orderId: String(msg.i || ""),
+          clientOrderId: msg.c,
+          tradingPair: msg.s || "",
+          side: (msg.S as OrderSide) || "BUY",
+          orderType: msg.o || "LIMIT",
+          price: parseFloat(msg.p || "0"),
+          quantity: parseFloat(msg.q || "0"),
+          filledQuantity: parseFloat(msg.l || "0"),
+          status: (msg.X as OrderStatus) || "NEW",
+          gridLevel: parseGridLevel(msg.c || ""),
+          createdAt: new Date(msg.E || Date.now()),
         };
 
+        // A fill adds a trade, so the cached trade list is stale
+        if (order.status === "FILLED" || order.status === "PARTIALLY_FILLED") {
+          this.tradesCache = null;
+        }
+
         for (const callback of this.orderCallbacks) {
           callback(order);
         }
@@ -595,69 +837,76 @@ export class BinanceClient {
    * SELL orders fill when price >= order price
    */
   private checkSimulatedOrderFills(currentPrice: number): void {
-    const quoteAsset = config.quoteAsset || "USDT";
-    const baseAsset = config.baseAsset || "DOGE";
-    const quoteBalance = this.simulatedBalances.get(quoteAsset);
-    const baseBalance = this.simulatedBalances.get(baseAsset);
-
-    for (const [orderId, order] of this.simulatedOrders) {
-      if (order.status !== "NEW") continue;
-
-      let shouldFill = false;
-
-      if (order.side === "BUY" && currentPrice <= order.price) {
-        shouldFill = true;
-      } else if (order.side === "SELL" && currentPrice >= order.price) {
-        shouldFill = true;
-      }
+    const quoteBalance = this.simulatedBalances.get(this.quoteAsset);
+    const baseBalance = this.simulatedBalances.get(this.baseAsset);
+
+    // Only orders at the top of each heap can cross, so pop until the
+    // best resting price is out of reach instead of scanning every order.
+    // Ids no longer in simulatedOrders were cancelled and are skipped.
+    const crossed: SimulatedOrder[] = [];
+    const buys = this.simulatedBuys;
+    const sells = this.simulatedSells;
+    for (let top = buys.peek(); top && currentPrice <= top.price; ) {
+      buys.pop();
+      const order = this.simulatedOrders.get(top.orderId);
+      if (order) crossed.push(order);
+      top = buys.peek();
+    }
+    for (let top = sells.peek(); top && currentPrice >= top.price; ) {
+      sells.pop();
+      const order = this.simulatedOrders.get(top.orderId);
+      if (order) crossed.push(order);
+      top = sells.peek();
+    }
 
-      if (shouldFill) {
-        // Update order status
-        order.status = "FILLED";
-        order.filledQuantity = order.quantity;
-
-        // Update balances
-        if (order.side === "BUY") {
-          // Bought: locked quote -> free base
-          const cost = order.price * order.quantity;
-          if (quoteBalance) {
-            quoteBalance.locked -= cost;
-            quoteBalance.total = quoteBalance.free + quoteBalance.locked;
-          }
-          if (baseBalance) {
-            baseBalance.free += order.quantity;
-            baseBalance.total = baseBalance.free + baseBalance.locked;
-          }
-        } else {
-          // Sold: locked base -> free quote
-          const revenue = order.price * order.quantity;
-          if (baseBalance) {
-            baseBalance.locked -= order.quantity;
-            baseBalance.total = baseBalance.free + baseBalance.locked;
-          }
-          if (quoteBalance) {
-            quoteBalance.free += revenue;
-            quoteBalance.total = quoteBalance.free + quoteBalance.locked;
-          }
+    for (const order of crossed) {
+      // Update order status and retire it from the resting book
+      order.status = "FILLED";
+      order.filledQuantity = order.quantity;
+      this.simulatedOrders.delete(order.orderId);
+      this.simulatedFills.push(order);
+
+      // Update balances
+      if (order.side === "BUY") {
+        // Bought: locked quote -> free base
+        const cost = order.price * order.quantity;
+        if (quoteBalance) {
+          quoteBalance.locked -= cost;
+          quoteBalance.total = quoteBalance.free + quoteBalance.locked;
+        }
+        if (baseBalance) {
+          baseBalance.free += order.quantity;
+          baseBalance.total = baseBalance.free + baseBalance.locked;
+        }
+      } else {
+        // Sold: locked base -> free quote
+        const revenue = order.price * order.quantity;
+        if (baseBalance) {
+          baseBalance.locked -= order.quantity;
+          baseBalance.total = baseBalance.free + baseBalance.locked;
+        }
+        if (quoteBalance) {
+          quoteBalance.free += revenue;
+          quoteBalance.total = quoteBalance.free + quoteBalance.locked;
         }
+      }
 
-        logger.info(
-          {
-            orderId,
-            side: order.side,
-            price: order.price,
-            quantity: order.quantity,
-            currentPrice,
-            gridLevel: order.gridLevel,
-            simulated: true,
-          },
-          "[SIMULATION] Order FILLED",
-        );
+      logger.info(
+        {
+          orderId: order.orderId,
+          side: order.side,
+          price: order.price,
+          quantity: order.quantity,
+          currentPrice,
+          gridLevel: order.gridLevel,
+          simulated: true,
+        },
+        "[SIMULATION] Order FILLED",
+      );
 
-        // Notify callbacks about the filled order
-        for (const callback of this.orderCallbacks) {
-          callback(order);
-        }
+      // Notify callbacks about the filled order
+      for (const callback of this.orderCallbacks) {
+        callback(order);
       }
     }
   }
@@ -666,9 +915,7 @@ export class BinanceClient {
    * Get simulated trades (filled orders)
    */
   getSimulatedTrades(): Order[] {
-    return Array.from(this.simulatedOrders.values()).filter(
-      (o) => o.status === "FILLED",
-    );
+    return [...this.simulatedFills];
   }
 
   /**
@@ -1,10 +1,20 @@
+import { performance } from "perf_hooks";
 import Binance from "binance";
 import { config } from "../utils/config.js";
 import { createLogger } from "../utils/logger.js";
+import { parseGridLevel } from "../utils/orderId.js";
+import { binanceHttpsAgent } from "./httpAgent.js";
 import type { Order, OrderSide, OrderStatus } from "../types/index.js";
 
 const logger = createLogger("binance-streams");
 
+// Market streams push at least once a second per symbol, so this much
+// silence means the feed is dead even if the socket still looks open
+const STREAM_STALE_MS = 30000;
+
+// Binance allows up to 1024 streams per connection; stay well below it
+const MAX_STREAMS_PER_CONNECTION = 200;
+
 export interface TickerData {
   symbol: string;
   price: number;
@@ -30,6 +40,52 @@ type TradeCallback = (data: TradeData) => void;
 type OrderCallback = (order: Order) => void;
 type ConnectionCallback = (connected: boolean) => void;
 
+// Raw stream payloads, using Binance's short field names. Orders and
+// tickers are built straight from these instead of from the client's
+// beautified copy of every frame. Only the fields read here are declared.
+interface RawTickerEvent {
+  e: "24hrMiniTicker" | "24hrTicker";
+  E: number; // Event time
+  s: string; // Symbol
+  c: string; // Close price
+  p?: string; // Price change (full ticker only)
+  P?: string; // Price change percent (full ticker only)
+  h: string; // High price
+  l: string; // Low price
+  v: string; // Base asset volume
+}
+
+interface RawTradeEvent {
+  e: "trade";
+  E: number; // Event time
+  s: string; // Symbol
+  t: number; // Trade id
+  p: string; // Price
+  q: string; // Quantity
+  m: boolean; // Is the buyer the market maker
+}
+
+interface RawExecutionReportEvent {
+  e: "executionReport";
+  E: number; // Event time
+  s: string; // Symbol
+  c: string; // Client order id
+  S: string; // Side
+  o: string; // Order type
+  p: string; // Price
+  q: string; // Quantity
+  l: string; // Last filled quantity
+  z: string; // Cumulative filled quantity
+  X: string; // Order status
+  i: number; // Order id
+}
+
+type RawStreamEvent =
+  | RawTickerEvent
+  | RawTradeEvent
+  | RawExecutionReportEvent
+  | { e?: undefined };
+
 /**
  * BinanceStreamManager handles real-time WebSocket connections to Binance
  * for multiple trading pairs simultaneously.
@@ -37,6 +93,11 @@ type ConnectionCallback = (connected: boolean) => void;
 export class BinanceStreamManager {
   private wsClient: Binance.WebsocketClient | null = null;
   private subscribedSymbols: Set<string> = new Set();
+  // Ticker subscriptions made in the same tick share one connection
+  private pendingTickerSymbols: string[] = [];
+  private tickerFlushScheduled = false;
+  // Callback lists are copy-on-write: registration replaces the array, so
+  // dispatch loops always iterate a stable snapshot without copying it
   private tickerCallbacks: Map<string, TickerCallback[]> = new Map();
   private tradeCallbacks: Map<string, TradeCallback[]> = new Map();
   private orderCallbacks: OrderCallback[] = [];
@@ -47,6 +108,10 @@ export class BinanceStreamManager {
   private reconnectDelay = 5000;
   private userStreamListenKey: string | null = null;
   private userStreamKeepAliveInterval: NodeJS.Timeout | null = null;
+  // One watchdog per connection; each frame only stamps lastMessageAt
+  private heartbeatInterval: NodeJS.Timeout | null = null;
+  private lastMessageAt = 0;
+  private streamStale = false;
   private restClient: Binance.MainClient | null = null;
 
   constructor() {
@@ -79,7 +144,9 @@ export class BinanceStreamManager {
     }
 
     // eslint-disable-next-line @typescript-eslint/no-explicit-any, @typescript-eslint/no-unsafe-argument
-    this.restClient = new Binance.MainClient(clientOptions as any);
+    this.restClient = new Binance.MainClient(clientOptions as any, {
+      httpsAgent: binanceHttpsAgent,
+    });
 
     logger.info(
       { baseUrl, binanceUs: config.binanceUs },
@@ -107,11 +174,12 @@ export class BinanceStreamManager {
       this.wsClient = new Binance.WebsocketClient({
         api_key: config.binanceApiKey,
         api_secret: config.binanceApiSecret,
-        beautify: true,
+        beautify: false,
         wsUrl: wsBaseUrl,
       });
 
       this.setupEventHandlers();
+      this.startHeartbeat();
 
       this.isConnected = true;
       this.reconnectAttempts = 0;
@@ -131,27 +199,20 @@ export class BinanceStreamManager {
   private setupEventHandlers(): void {
     if (!this.wsClient) return;
 
-    // Debug: log ALL events
     this.wsClient.on("message", (data: unknown) => {
-      logger.debug(
-        { data: JSON.stringify(data).substring(0, 200) },
-        "Raw WebSocket message received",
-      );
-      this.handleMessage(data);
-    });
-
-    // Handle ticker updates (24hr rolling window)
-    this.wsClient.on("formattedMessage", (data: unknown) => {
-      logger.debug(
-        { data: JSON.stringify(data).substring(0, 200) },
-        "Formatted WebSocket message received",
-      );
-      this.handleMessage(data);
-    });
+      if (logger.isLevelEnabled("debug")) {
+        logger.debug(
+          { data: JSON.stringify(data).substring(0, 200) },
+          "Raw WebSocket message received",
+        );
+      }
 
-    // Handle user data messages (order updates)
-    this.wsClient.on("formattedUserDataMessage", (data: unknown) => {
-      this.handleUserDataMessage(data);
+      const msg = data as RawStreamEvent;
+      if (msg.e === "executionReport") {
+        this.handleUserDataMessage(msg);
+      } else {
+        this.handleMessage(msg);
+      }
     });
 
     // Handle connection open
@@ -183,143 +244,87 @@ export class BinanceStreamManager {
     });
   }
 
-  private handleMessage(data: unknown): void {
-    const msg = data as {
-      eventType?: string;
-      symbol?: string;
-      close?: string;
-      lastPrice?: string;
-      priceChange?: string;
-      priceChangePercent?: string;
-      high?: string;
-      low?: string;
-      volume?: string;
-      eventTime?: number;
-      // Trade data
-      tradeId?: number;
-      price?: string;
-      quantity?: string;
-      buyerMaker?: boolean;
-    };
+  private handleMessage(msg: RawStreamEvent): void {
+    if (msg.e === undefined) return;
 
-    // Debug: log all messages to see what we're receiving
-    logger.debug(
-      {
-        eventType: msg.eventType,
-        symbol: msg.symbol,
-        hasPrice: !!msg.close || !!msg.lastPrice,
-      },
-      "WebSocket message received",
-    );
+    this.lastMessageAt = performance.now();
+    if (this.streamStale) {
+      this.streamStale = false;
+      logger.info("Market data stream resumed");
+      this.notifyConnectionStatus(true);
+    }
 
     // Handle mini ticker (24hrMiniTicker) or 24hr ticker
-    if (
-      (msg.eventType === "24hrMiniTicker" || msg.eventType === "24hrTicker") &&
-      msg.symbol
-    ) {
+    if ((msg.e === "24hrMiniTicker" || msg.e === "24hrTicker") && msg.s) {
       const tickerData: TickerData = {
-        symbol: msg.symbol,
-        price: parseFloat(msg.close || msg.lastPrice || "0"),
-        priceChange: parseFloat(msg.priceChange || "0"),
-        priceChangePercent: parseFloat(msg.priceChangePercent || "0"),
-        high: parseFloat(msg.high || "0"),
-        low: parseFloat(msg.low || "0"),
-        volume: parseFloat(msg.volume || "0"),
-        timestamp: msg.eventTime || Date.now(),
+        symbol: msg.s,
+        price: parseFloat(msg.c || "0"),
+        priceChange: parseFloat(msg.p || "0"),
+        priceChangePercent: parseFloat(msg.P || "0"),
+        high: parseFloat(msg.h || "0"),
+        low: parseFloat(msg.l || "0"),
+        volume: parseFloat(msg.v || "0"),
+        timestamp: msg.E || Date.now(),
       };
 
-      const callbacks = this.tickerCallbacks.get(msg.symbol) || [];
+      const callbacks = this.tickerCallbacks.get(msg.s) || [];
       for (const callback of callbacks) {
         try {
           callback(tickerData);
         } catch (error) {
-          logger.error(
-            { error, symbol: msg.symbol },
-            "Error in ticker callback",
-          );
+          logger.error({ error, symbol: msg.s }, "Error in ticker callback");
         }
       }
     }
 
     // Handle individual trades
-    if (msg.eventType === "trade" && msg.symbol) {
+    if (msg.e === "trade" && msg.s) {
       const tradeData: TradeData = {
-        symbol: msg.symbol,
-        tradeId: String(msg.tradeId || ""),
-        price: parseFloat(msg.price || "0"),
-        quantity: parseFloat(msg.quantity || "0"),
-        buyerMaker: msg.buyerMaker || false,
-        timestamp: msg.eventTime || Date.now(),
+        symbol: msg.s,
+        tradeId: String(msg.t || ""),
+        price: parseFloat(msg.p || "0"),
+        quantity: parseFloat(msg.q || "0"),
+        buyerMaker: msg.m || false,
+        timestamp: msg.E || Date.now(),
       };
 
-      const callbacks = this.tradeCallbacks.get(msg.symbol) || [];
+      const callbacks = this.tradeCallbacks.get(msg.s) || [];
       for (const callback of callbacks) {
         try {
           callback(tradeData);
         } catch (error) {
-          logger.error(
-            { error, symbol: msg.symbol },
-            "Error in trade callback",
-          );
+          logger.error({ error, symbol: msg.s }, "Error in trade callback");
         }
       }
     }
   }
 
-  private handleUserDataMessage(data: unknown): void {
-    const msg = data as {
-      eventType?: string;
-      orderId?: number;
-      newClientOrderId?: string;
-      symbol?: string;
-      side?: string;
-      orderType?: string;
-      price?: string;
-      quantity?: string;
-      lastFilledQuantity?: string;
-      cumulativeFilledQuantity?: string;
-      orderStatus?: string;
-      eventTime?: number;
+  private handleUserDataMessage(msg: RawExecutionReportEvent): void {
+    const order: Order = {
+      orderId: String(msg.i || ""),
+      clientOrderId: msg.c,
+      tradingPair: msg.s || "",
+      side: (msg.S as OrderSide) || "BUY",
+      orderType: msg.o || "LIMIT",
+      price: parseFloat(msg.p || "0"),
+      quantity: parseFloat(msg.q || "0"),
+      filledQuantity: parseFloat(msg.z || msg.l || "0"),
+      status: (msg.X as OrderStatus) || "NEW",
+      gridLevel: parseGridLevel(msg.c || ""),
+      createdAt: new Date(msg.E || Date.now()),
     };
 
-    if (msg.eventType === "executionReport") {
-      const order: Order = {
-        orderId: String(msg.orderId || ""),
-        clientOrderId: msg.newClientOrderId,
-        tradingPair: msg.symbol || "",
-        side: (msg.side as OrderSide) || "BUY",
-        orderType: msg.orderType || "LIMIT",
-        price: parseFloat(msg.price || "0"),
-        quantity: parseFloat(msg.quantity || "0"),
-        filledQuantity: parseFloat(
-          msg.cumulativeFilledQuantity || msg.lastFilledQuantity || "0",
-        ),
-        status: (msg.orderStatus as OrderStatus) || "NEW",
-        gridLevel: this.extractGridLevel(msg.newClientOrderId || ""),
-        createdAt: new Date(msg.eventTime || Date.now()),
-      };
-
+    if (logger.isLevelEnabled("debug")) {
       logger.debug({ order }, "Order update received via WebSocket");
-
-      for (const callback of this.orderCallbacks) {
-        try {
-          callback(order);
-        } catch (error) {
-          logger.error({ error }, "Error in order callback");
-        }
-      }
     }
-  }
 
-  private extractGridLevel(clientOrderId: string): number | undefined {
-    if (clientOrderId?.startsWith("grid_")) {
-      const parts = clientOrderId.split("_");
-      if (parts.length >= 2) {
-        const level = parseInt(parts[1], 10);
-        if (!isNaN(level)) return level;
+    for (const callback of this.orderCallbacks) {
+      try {
+        callback(order);
+      } catch (error) {
+        logger.error({ error }, "Error in order callback");
       }
     }
-    return undefined;
   }
 
   private handleReconnect(): void {
@@ -340,8 +345,10 @@ export class BinanceStreamManager {
       void (async () => {
         try {
           this.connect();
-          // Re-subscribe to all symbols
-          for (const symbol of this.subscribedSymbols) {
+          // Re-subscribe to all symbols on the new client
+          const symbols = Array.from(this.subscribedSymbols);
+          this.subscribedSymbols.clear();
+          for (const symbol of symbols) {
             this.subscribeToTicker(symbol);
           }
           // Re-start user stream if it was active
@@ -355,6 +362,37 @@ export class BinanceStreamManager {
     }, delay);
   }
 
+  /**
+   * Watch for a silent market data feed with a single timer instead of
+   * a per-message timeout
+   */
+  private startHeartbeat(): void {
+    this.stopHeartbeat();
+    this.lastMessageAt = performance.now();
+    this.streamStale = false;
+
+    this.heartbeatInterval = setInterval(() => {
+      if (this.streamStale || this.subscribedSymbols.size === 0) return;
+
+      const silentMs = performance.now() - this.lastMessageAt;
+      if (silentMs >= STREAM_STALE_MS) {
+        this.streamStale = true;
+        logger.warn(
+          { silentMs: Math.round(silentMs) },
+          "No market data received, treating stream as disconnected",
+        );
+        this.notifyConnectionStatus(false);
+      }
+    }, STREAM_STALE_MS / 2);
+  }
+
+  private stopHeartbeat(): void {
+    if (this.heartbeatInterval) {
+      clearInterval(this.heartbeatInterval);
+      this.heartbeatInterval = null;
+    }
+  }
+
   private notifyConnectionStatus(connected: boolean): void {
     for (const callback of this.connectionCallbacks) {
       try {
@@ -379,10 +417,36 @@ export class BinanceStreamManager {
       return;
     }
 
-    // Use mini ticker for individual symbol price updates (more reliable for Binance.US)
-    this.wsClient.subscribeSpotSymbolMini24hrTicker(symbol);
     this.subscribedSymbols.add(symbol);
-    logger.info({ symbol }, "Subscribed to mini ticker stream");
+    this.pendingTickerSymbols.push(symbol);
+
+    if (!this.tickerFlushScheduled) {
+      this.tickerFlushScheduled = true;
+      queueMicrotask(() => this.flushTickerSubscriptions());
+    }
+  }
+
+  /**
+   * Open the queued ticker subscriptions, multiplexing up to
+   * MAX_STREAMS_PER_CONNECTION streams on each socket instead of one
+   * socket per symbol
+   */
+  private flushTickerSubscriptions(): void {
+    this.tickerFlushScheduled = false;
+    const symbols = this.pendingTickerSymbols;
+    this.pendingTickerSymbols = [];
+    if (!this.wsClient || symbols.length === 0) return;
+
+    for (let i = 0; i < symbols.length; i += MAX_STREAMS_PER_CONNECTION) {
+      const batch = symbols.slice(i, i + MAX_STREAMS_PER_CONNECTION);
+      // Use mini ticker for individual symbol price updates (more reliable
+      // for Binance.US); raw /ws/ paths accept several '/'-joined streams
+      const endpoint = batch
+        .map((symbol) => `${symbol.toLowerCase()}@miniTicker`)
+        .join("/");
+      this.wsClient.subscribeEndpoint(endpoint, "spot");
+      logger.info({ symbols: batch }, "Subscribed to mini ticker streams");
+    }
   }
 
   /**
@@ -494,8 +558,7 @@ export class BinanceStreamManager {
    */
   onTicker(symbol: string, callback: TickerCallback): void {
     const callbacks = this.tickerCallbacks.get(symbol) || [];
-    callbacks.push(callback);
-    this.tickerCallbacks.set(symbol, callbacks);
+    this.tickerCallbacks.set(symbol, [...callbacks, callback]);
   }
 
   /**
@@ -503,22 +566,21 @@ export class BinanceStreamManager {
    */
   onTrade(symbol: string, callback: TradeCallback): void {
     const callbacks = this.tradeCallbacks.get(symbol) || [];
-    callbacks.push(callback);
-    this.tradeCallbacks.set(symbol, callbacks);
+    this.tradeCallbacks.set(symbol, [...callbacks, callback]);
   }
 
   /**
    * Register a callback for order updates
    */
   onOrder(callback: OrderCallback): void {
-    this.orderCallbacks.push(callback);
+    this.orderCallbacks = [...this.orderCallbacks, callback];
   }
 
   /**
    * Register a callback for connection status changes
    */
   onConnectionChange(callback: ConnectionCallback): void {
-    this.connectionCallbacks.push(callback);
+    this.connectionCallbacks = [...this.connectionCallbacks, callback];
   }
 
   /**
@@ -533,6 +595,8 @@ export class BinanceStreamManager {
    * Disconnect from all WebSocket streams
    */
   disconnect(): void {
+    this.stopHeartbeat();
+
     if (this.userStreamKeepAliveInterval) {
       clearInterval(this.userStreamKeepAliveInterval);
       this.userStreamKeepAliveInterval = null;
@@ -544,6 +608,7 @@ export class BinanceStreamManager {
     }
 
     this.subscribedSymbols.clear();
+    this.pendingTickerSymbols = [];
     this.tickerCallbacks.clear();
     this.tradeCallbacks.clear();
     this.orderCallbacks = [];
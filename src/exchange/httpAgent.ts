@@ -0,0 +1,14 @@
+import { Agent } from "https";
+
+/**
+ * Shared keep-alive agent for Binance REST clients.
+ * Grid setup and rebuilds send bursts of order requests; reusing warm
+ * TCP/TLS connections avoids paying a handshake per request.
+ */
+export const binanceHttpsAgent = new Agent({
+  keepAlive: true,
+  keepAliveMsecs: 30_000,
+  maxSockets: 50, // Headroom for batched grid placement across pairs
+  maxFreeSockets: 20,
+  scheduling: "lifo", // Prefer the most recently used (still warm) socket
+});
@@ -135,96 +135,87 @@ export const ToggleSimulationSchema = z.object({
   confirmLiveTrading: z.boolean().optional(),
 });
 
-// Validation middleware factory
+// Validation middleware factories
+// safeParse reports failures as a result instead of throwing, so bad input
+// doesn't pay for building and unwinding a ZodError stack trace
+function formatIssues(error: z.ZodError) {
+  return error.errors.map((err) => ({
+    field: err.path.join("."),
+    message: err.message,
+  }));
+}
+
 export function validateBody<T extends z.ZodType>(schema: T) {
   return (req: Request, res: Response, next: NextFunction): void => {
-    try {
-      req.body = schema.parse(req.body) as z.infer<T>;
-      next();
-    } catch (error) {
-      if (error instanceof z.ZodError) {
-        logger.warn(
-          { errors: error.errors, path: req.path },
-          "Validation failed",
-        );
-        res.status(400).json({
-          error: "Validation failed",
-          details: error.errors.map((err) => ({
-            field: err.path.join("."),
-            message: err.message,
-          })),
-        });
-      } else {
-        logger.error({ error }, "Unexpected validation error");
-        res.status(400).json({ error: "Invalid request" });
-      }
+    const result = schema.safeParse(req.body);
+    if (!result.success) {
+      logger.warn(
+        { errors: result.error.errors, path: req.path },
+        "Validation failed",
+      );
+      res.status(400).json({
+        error: "Validation failed",
+        details: formatIssues(result.error),
+      });
+      return;
     }
+
+    req.body = result.data as z.infer<T>;
+    next();
   };
 }
 
 export function validateQuery<T extends z.ZodType>(schema: T) {
   return (req: Request, res: Response, next: NextFunction): void => {
-    try {
-      // Parse query parameters with proper type coercion
-      const parsedQuery: Record<string, string | number | undefined> = {};
-      for (const [key, value] of Object.entries(req.query)) {
-        if (typeof value === "string") {
-          // Try to parse as number if it looks like a number
-          if (!isNaN(Number(value)) && value !== "") {
-            parsedQuery[key] = Number(value);
-          } else {
-            parsedQuery[key] = value;
-          }
+    // Parse query parameters with proper type coercion
+    const parsedQuery: Record<string, string | number | undefined> = {};
+    for (const [key, value] of Object.entries(req.query)) {
+      if (typeof value === "string") {
+        // Try to parse as number if it looks like a number
+        if (!isNaN(Number(value)) && value !== "") {
+          parsedQuery[key] = Number(value);
         } else {
-          parsedQuery[key] = value as string | number | undefined;
+          parsedQuery[key] = value;
         }
-      }
-
-      req.query = schema.parse(parsedQuery) as z.infer<T>;
-      next();
-    } catch (error) {
-      if (error instanceof z.ZodError) {
-        logger.warn(
-          { errors: error.errors, path: req.path },
-          "Query validation failed",
-        );
-        res.status(400).json({
-          error: "Invalid query parameters",
-          details: error.errors.map((err) => ({
-            field: err.path.join("."),
-            message: err.message,
-          })),
-        });
       } else {
-        logger.error({ error }, "Unexpected query validation error");
-        res.status(400).json({ error: "Invalid request" });
+        parsedQuery[key] = value as string | number | undefined;
       }
     }
+
+    const result = schema.safeParse(parsedQuery);
+    if (!result.success) {
+      logger.warn(
+        { errors: result.error.errors, path: req.path },
+        "Query validation failed",
+      );
+      res.status(400).json({
+        error: "Invalid query parameters",
+        details: formatIssues(result.error),
+      });
+      return;
+    }
+
+    req.query = result.data as z.infer<T>;
+    next();
   };
 }
 
 export function validateParams<T extends z.ZodType>(schema: T) {
   return (req: Request, res: Response, next: NextFunction): void => {
-    try {
-      req.params = schema.parse(req.params) as z.infer<T>;
-      next();
-    } catch (error) {
-      if (error instanceof z.ZodError) {
-        logger.warn(
-          { errors: error.errors, path: req.path },
-          "Params validation failed",
-        );
-        res.status(400).json({
-          error: "Invalid URL parameters",
-          details: error.errors.map((err) => ({
-            field: err.path.join("."),
-            message: err.message,
-          })),
-        });
-      } else {
-        logger.error({ error }, "Unexpected params validation error");
-        res.status(400).json({ error: "Invalid request" });
-      }
+    const result = schema.safeParse(req.params);
+    if (!result.success) {
+      logger.warn(
+        { errors: result.error.errors, path: req.path },
+        "Params validation failed",
+      );
+      res.status(400).json({
+        error: "Invalid URL parameters",
+        details: formatIssues(result.error),
+      });
+      return;
     }
+
+    req.params = result.data as z.infer<T>;
+    next();
   };
 }
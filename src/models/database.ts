@@ -16,6 +16,8 @@ const DB_PATH =
 
 class TradingDatabase {
   private db: Database.Database | null = null;
+  // Hot-path write statements, compiled once on first use
+  private statements: Map<string, Database.Statement> = new Map();
 
   constructor() {
     this.initialize();
@@ -31,6 +33,9 @@ class TradingDatabase {
 
       this.db = new Database(DB_PATH);
       this.db.pragma("journal_mode = WAL");
+      // WAL only needs syncing at checkpoints; commits stay durable against
+      // process crashes, which is all the trade log needs
+      this.db.pragma("synchronous = NORMAL");
       this.db.pragma("foreign_keys = ON");
 
       this.createTables();
@@ -41,6 +46,28 @@ class TradingDatabase {
     }
   }
 
+  /**
+   * Prepare a statement once and reuse it; prepare() compiles the SQL again
+   * on every call
+   */
+  private prepare(db: Database.Database, sql: string): Database.Statement {
+    let stmt = this.statements.get(sql);
+    if (!stmt) {
+      stmt = db.prepare(sql);
+      this.statements.set(sql, stmt);
+    }
+    return stmt;
+  }
+
+  /**
+   * Run several writes as a single transaction (one commit instead of one
+   * per statement)
+   */
+  transaction(fn: () => void): void {
+    if (!this.db) return;
+    this.db.transaction(fn)();
+  }
+
   private createTables(): void {
     if (!this.db) return;
 
@@ -167,12 +194,15 @@ class TradingDatabase {
   }): void {
     if (!this.db) return;
 
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(
+      this.db,
+      `
       INSERT OR REPLACE INTO trades (
         trade_id, order_id, symbol, side, price, quantity,
         commission, commission_asset, realized_pnl, grid_level, executed_at
       ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    `);
+    `,
+    );
 
     stmt.run(
       trade.tradeId,
@@ -268,11 +298,14 @@ class TradingDatabase {
   saveGridState(symbol: string, levels: GridLevelState[]): void {
     if (!this.db) return;
 
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(
+      this.db,
+      `
       INSERT OR REPLACE INTO grid_states (
         symbol, level, price, buy_order_id, sell_order_id, status, filled_at, updated_at
       ) VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-    `);
+    `,
+    );
 
     const transaction = this.db.transaction(() => {
       for (const level of levels) {
@@ -344,25 +377,24 @@ class TradingDatabase {
   }): void {
     if (!this.db) return;
 
-    this.db
-      .prepare(
-        `
+    this.prepare(
+      this.db,
+      `
       INSERT OR REPLACE INTO pair_states (
         symbol, status, current_price, position_size, position_value,
         realized_pnl, unrealized_pnl, trades_count, updated_at
       ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
     `,
-      )
-      .run(
-        state.symbol,
-        state.status,
-        state.currentPrice,
-        state.positionSize,
-        state.positionValue,
-        state.realizedPnl,
-        state.unrealizedPnl,
-        state.tradesCount,
-      );
+    ).run(
+      state.symbol,
+      state.status,
+      state.currentPrice,
+      state.positionSize,
+      state.positionValue,
+      state.realizedPnl,
+      state.unrealizedPnl,
+      state.tradesCount,
+    );
   }
 
   getPairState(symbol: string): {
@@ -608,14 +640,38 @@ class TradingDatabase {
   ): void {
     if (!this.db) return;
 
-    this.db
-      .prepare(
-        `
+    this.prepare(
+      this.db,
+      `
       INSERT OR IGNORE INTO price_history (symbol, price, timestamp)
       VALUES (?, ?, ?)
     `,
-      )
-      .run(symbol, price, timestamp.toISOString());
+    ).run(symbol, price, timestamp.toISOString());
+  }
+
+  /**
+   * Save one price per symbol in a single transaction
+   */
+  savePricePoints(
+    points: { symbol: string; price: number }[],
+    timestamp: Date = new Date(),
+  ): void {
+    if (!this.db) return;
+
+    const stmt = this.prepare(
+      this.db,
+      `
+      INSERT OR IGNORE INTO price_history (symbol, price, timestamp)
+      VALUES (?, ?, ?)
+    `,
+    );
+    const iso = timestamp.toISOString();
+
+    this.db.transaction(() => {
+      for (const point of points) {
+        stmt.run(point.symbol, point.price, iso);
+      }
+    })();
   }
 
   getPriceHistory(
@@ -728,6 +784,7 @@ class TradingDatabase {
 
   close(): void {
     if (this.db) {
+      this.statements.clear();
       this.db.close();
       this.db = null;
       logger.info("Database closed");
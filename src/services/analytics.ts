@@ -410,10 +410,16 @@ export class AnalyticsService {
     maxDrawdown: number;
     maxDrawdownPercent: number;
   } {
-    if (curve.length === 0) return { maxDrawdown: 0, maxDrawdownPercent: 0 };
-
-    const maxDrawdown = Math.max(...curve.map((p) => p.drawdown));
-    const maxDrawdownPercent = Math.max(...curve.map((p) => p.drawdownPercent));
+    // One pass with running maxima; spreading mapped copies into Math.max
+    // allocates twice and overflows the call stack on long trade histories
+    let maxDrawdown = 0;
+    let maxDrawdownPercent = 0;
+    for (const point of curve) {
+      if (point.drawdown > maxDrawdown) maxDrawdown = point.drawdown;
+      if (point.drawdownPercent > maxDrawdownPercent) {
+        maxDrawdownPercent = point.drawdownPercent;
+      }
+    }
 
     return { maxDrawdown, maxDrawdownPercent };
   }
@@ -111,23 +111,29 @@ export class PriceSimulator {
    * Update prices for all symbols
    */
   private updateAllPrices(): void {
+    const points: { symbol: string; price: number }[] = [];
+    const debug = logger.isLevelEnabled("debug");
+
     for (const [symbol, state] of this.priceStates) {
       const newPrice = this.generateNextPrice(state.currentPrice);
 
       // Update state
       state.currentPrice = newPrice;
       state.lastUpdate = new Date();
-
-      // Save to database for analytics
-      tradingDb.savePricePoint(symbol, newPrice);
+      points.push({ symbol, price: newPrice });
 
       // Notify callback (this will trigger grid bot checks)
       if (this.priceUpdateCallback) {
         this.priceUpdateCallback(symbol, newPrice);
       }
 
-      logger.debug({ symbol, price: newPrice.toFixed(6) }, "Price updated");
+      if (debug) {
+        logger.debug({ symbol, price: newPrice.toFixed(6) }, "Price updated");
+      }
     }
+
+    // Save the whole round to the database for analytics in one commit
+    tradingDb.savePricePoints(points);
   }
 
   /**
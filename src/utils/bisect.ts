@@ -0,0 +1,38 @@
+/**
+ * Binary search helpers for ascending price arrays
+ * Used to locate grid levels relative to a price in O(log N)
+ */
+
+/**
+ * Index of the first element >= value (insertion point left of equal values)
+ */
+export function bisectLeft(sorted: ArrayLike<number>, value: number): number {
+  let lo = 0;
+  let hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (sorted[mid] < value) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  return lo;
+}
+
+/**
+ * Index of the first element > value (insertion point right of equal values)
+ */
+export function bisectRight(sorted: ArrayLike<number>, value: number): number {
+  let lo = 0;
+  let hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (sorted[mid] <= value) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  return lo;
+}
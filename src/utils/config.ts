@@ -20,6 +20,7 @@ const ConfigSchema = z.object({
   gridCount: z.number().int().default(15),
   amountPerGrid: z.number().default(100), // 100 DOGE per grid (~$14)
   gridType: z.enum(["arithmetic", "geometric"]).default("arithmetic"),
+  postOnlyOrders: z.boolean().default(false), // Maker-only (GTX) limit orders
 
   // Multi-pair portfolio settings
   portfolioMode: z.boolean().default(false),
@@ -74,6 +75,7 @@ function loadConfig(): Config {
     baseAsset: process.env.BASE_ASSET,
     quoteAsset: process.env.QUOTE_ASSET,
     gridType: process.env.GRID_TYPE as "arithmetic" | "geometric" | undefined,
+    postOnlyOrders: process.env.POST_ONLY_ORDERS?.toLowerCase() === "true",
     portfolioMode: process.env.PORTFOLIO_MODE?.toLowerCase() === "true",
     totalCapital: process.env.TOTAL_CAPITAL
       ? parseFloat(process.env.TOTAL_CAPITAL)
@@ -118,23 +120,53 @@ function loadConfig(): Config {
 
 export const config = loadConfig();
 
-export function getGridLevels(): number[] {
-  const levels: number[] = [];
-  const { gridUpper, gridLower, gridCount, gridType } = config;
+// Grid inputs are fixed once a bot is configured, so each ladder is built
+// once and shared; keyed by the values that determine it. Live bots only
+// need a handful, so the least recently used ladder is evicted past the cap.
+const GRID_LEVELS_CACHE_SIZE = 32;
+const gridLevelsCache = new Map<string, readonly number[]>();
+
+export function computeGridLevels(
+  gridLower: number,
+  gridUpper: number,
+  gridCount: number,
+  gridType: Config["gridType"],
+): readonly number[] {
+  const key = `${gridType}:${gridLower}:${gridUpper}:${gridCount}`;
+  const cached = gridLevelsCache.get(key);
+  if (cached) {
+    // Re-insert so the map stays in least-recently-used order
+    gridLevelsCache.delete(key);
+    gridLevelsCache.set(key, cached);
+    return cached;
+  }
+
+  const levels = new Array<number>(gridCount + 1);
 
   if (gridType === "geometric") {
     const ratio = Math.pow(gridUpper / gridLower, 1 / gridCount);
     for (let i = 0; i <= gridCount; i++) {
-      levels.push(gridLower * Math.pow(ratio, i));
+      levels[i] = gridLower * Math.pow(ratio, i);
     }
   } else {
     const spacing = (gridUpper - gridLower) / gridCount;
     for (let i = 0; i <= gridCount; i++) {
-      levels.push(gridLower + spacing * i);
+      levels[i] = gridLower + spacing * i;
     }
   }
 
-  return levels;
+  const frozen = Object.freeze(levels);
+  if (gridLevelsCache.size >= GRID_LEVELS_CACHE_SIZE) {
+    const oldest = gridLevelsCache.keys().next();
+    if (!oldest.done) gridLevelsCache.delete(oldest.value);
+  }
+  gridLevelsCache.set(key, frozen);
+  return frozen;
+}
+
+export function getGridLevels(): readonly number[] {
+  const { gridUpper, gridLower, gridCount, gridType } = config;
+  return computeGridLevels(gridLower, gridUpper, gridCount, gridType);
 }
 
 /**
@@ -3,46 +3,55 @@ import { config } from "./config.js";
 
 const isDevelopment = process.env.NODE_ENV !== "production";
 
-export const logger: Logger = pino({
-  level: isDevelopment ? config.logLevel : "info",
-  // Only use pino-pretty in development for performance
-  ...(isDevelopment
-    ? {
-        transport: {
-          target: "pino-pretty",
-          options: {
-            colorize: true,
-            translateTime: "SYS:standard",
-            ignore: "pid,hostname",
+// Production logs are written to stdout asynchronously so a slow consumer
+// of the pipe never blocks the event loop; pino flushes them on exit
+const destination = isDevelopment
+  ? undefined
+  : pino.destination({ dest: 1, sync: false });
+
+export const logger: Logger = pino(
+  {
+    level: isDevelopment ? config.logLevel : "info",
+    // Only use pino-pretty in development for performance
+    ...(isDevelopment
+      ? {
+          transport: {
+            target: "pino-pretty",
+            options: {
+              colorize: true,
+              translateTime: "SYS:standard",
+              ignore: "pid,hostname",
+            },
           },
-        },
-      }
-    : {
-        // Production: JSON output for log aggregation
-        formatters: {
-          level: (label) => {
-            return { level: label };
+        }
+      : {
+          // Production: JSON output for log aggregation
+          formatters: {
+            level: (label) => {
+              return { level: label };
+            },
           },
-        },
-        timestamp: pino.stdTimeFunctions.isoTime,
-      }),
-  // Redact sensitive data in logs
-  redact: {
-    paths: [
-      "req.headers.authorization",
-      "req.headers.cookie",
-      'res.headers["set-cookie"]',
-      "password",
-      "apiKey",
-      "apiSecret",
-      "secret",
-      "token",
-      "binanceApiKey",
-      "binanceApiSecret",
-    ],
-    remove: true,
+          timestamp: pino.stdTimeFunctions.isoTime,
+        }),
+    // Redact sensitive data in logs
+    redact: {
+      paths: [
+        "req.headers.authorization",
+        "req.headers.cookie",
+        'res.headers["set-cookie"]',
+        "password",
+        "apiKey",
+        "apiSecret",
+        "secret",
+        "token",
+        "binanceApiKey",
+        "binanceApiSecret",
+      ],
+      remove: true,
+    },
   },
-});
+  destination,
+);
 
 export function createLogger(name: string): Logger {
   return logger.child({ module: name });
@@ -0,0 +1,11 @@
+/**
+ * Numeric helpers for exchange payloads
+ * Binance REST fields are typed string | number ("numberInString")
+ */
+
+/**
+ * Read a numeric field without round-tripping numbers through String()
+ */
+export function toNumber(value: string | number): number {
+  return typeof value === "number" ? value : parseFloat(value);
+}
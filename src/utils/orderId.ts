@@ -0,0 +1,27 @@
+/**
+ * Client order id helpers
+ * Grid orders are tagged "grid_<level>_<side>_<timestamp>"
+ */
+
+const GRID_PREFIX = "grid_";
+const CHAR_0 = 48;
+const CHAR_9 = 57;
+
+/**
+ * Read the grid level from a client order id in one pass over its
+ * characters (no split() array or substring per call)
+ */
+export function parseGridLevel(clientOrderId: string): number | undefined {
+  if (!clientOrderId?.startsWith(GRID_PREFIX)) return undefined;
+
+  let level = 0;
+  let i = GRID_PREFIX.length;
+  const start = i;
+  for (; i < clientOrderId.length; i++) {
+    const code = clientOrderId.charCodeAt(i);
+    if (code < CHAR_0 || code > CHAR_9) break;
+    level = level * 10 + (code - CHAR_0);
+  }
+
+  return i > start ? level : undefined;
+}
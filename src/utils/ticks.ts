@@ -0,0 +1,47 @@
+/**
+ * Exchange tick/step size rounding on integer units
+ * Binance filters are decimal strings (e.g. "0.00001000"); flooring with
+ * Math.floor(x / tick) * tick in binary floats can leave values like
+ * 0.30000000000000004 that the exchange rejects as off-tick.
+ */
+
+export interface TickSize {
+  decimals: number; // Significant decimal places of the filter value
+  scale: number; // 10^decimals
+  units: number; // Filter value in 1/scale units (an integer)
+}
+
+/**
+ * Parse a Binance filter value once; returns undefined for zero/invalid sizes
+ */
+export function parseTickSize(value: string): TickSize | undefined {
+  const size = parseFloat(value);
+  if (!(size > 0)) return undefined;
+
+  const fraction = (value.split(".")[1] ?? "").replace(/0+$/, "");
+  const scale = 10 ** fraction.length;
+  return {
+    decimals: fraction.length,
+    scale,
+    units: Math.round(size * scale),
+  };
+}
+
+/**
+ * Round a value down to a whole number of ticks
+ */
+export function floorToTick(value: number, tick: TickSize): number {
+  // The small epsilon absorbs representation error, e.g. 0.29 * 100 = 28.99...
+  const scaled = Math.floor(value * tick.scale + 1e-6);
+  // Binance sizes are almost always a power of ten (units === 1)
+  if (tick.units === 1) return scaled / tick.scale;
+  return (scaled - (scaled % tick.units)) / tick.scale;
+}
+
+/**
+ * Format a tick-aligned value with exactly the tick's decimal places, for
+ * order parameters (String(number) can produce exponent notation)
+ */
+export function formatTick(value: number, tick: TickSize): string {
+  return value.toFixed(tick.decimals);
+}
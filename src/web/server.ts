@@ -1,6 +1,7 @@
 /* eslint-disable @typescript-eslint/require-await */
 import express, { Request, Response, NextFunction } from "express";
 import { createServer } from "http";
+import { performance } from "perf_hooks";
 import { WebSocketServer, WebSocket } from "ws";
 import path from "path";
 import { fileURLToPath } from "url";
@@ -43,6 +44,26 @@ const __dirname = path.dirname(__filename);
 
 const logger = createLogger("server");
 
+// Resolved once; the error handler below runs on every failed request
+const isProduction = process.env.NODE_ENV === "production";
+
+// Broadcasts to more clients than this are sent in batches, yielding to the
+// event loop between batches so HTTP requests are not starved
+const BROADCAST_BATCH_SIZE = 50;
+
+// A client with this much unsent data is not keeping up; its updates are
+// skipped (each broadcast is a full snapshot) until its buffer drains
+const MAX_CLIENT_BUFFERED_BYTES = 1024 * 1024;
+
+// Dashboard sockets get a protocol-level ping this often (browsers answer
+// it without any page code); one that hasn't answered by the next round is
+// terminated
+const WS_PING_INTERVAL_MS = 20000;
+
+// Status is pushed every second; the encoded payload is shared by the push
+// and /api/status for that long
+const STATUS_BROADCAST_MS = 1000;
+
 // Async handler wrapper for Express routes
 type AsyncRequestHandler = (
   req: Request,
@@ -66,6 +87,11 @@ export class WebServer {
   private riskManager: RiskManager;
   private clients: Set<WebSocket> = new Set();
   private statusInterval: NodeJS.Timeout | null = null;
+  // Encoded getStatusPayload() (encodedAt is a monotonic timestamp, ms)
+  private statusJson: { encodedAt: number; json: string } | null = null;
+  private pingInterval: NodeJS.Timeout | null = null;
+  // Clients pinged in the current round that haven't answered yet
+  private awaitingPong: Set<WebSocket> = new Set();
   private isPortfolioMode: boolean;
 
   constructor() {
@@ -74,7 +100,6 @@ export class WebServer {
     this.isPortfolioMode = config.portfolioMode;
 
     // Validate authentication requirements in production
-    const isProduction = process.env.NODE_ENV === "production";
     if (
       isProduction &&
       (!config.cognitoUserPoolId || !config.cognitoClientId)
@@ -103,6 +128,10 @@ export class WebServer {
   }
 
   private setupMiddleware(): void {
+    // API responses are live data that rarely repeat, so skip hashing every
+    // JSON body for an ETag (express.static keeps its own ETags)
+    this.app.set("etag", false);
+
     // Security headers
     this.app.use(
       helmet({
@@ -118,9 +147,11 @@ export class WebServer {
     );
 
     // CORS configuration
-    const allowedOrigins = process.env.ALLOWED_ORIGINS
-      ? process.env.ALLOWED_ORIGINS.split(",")
-      : ["http://localhost:3000", "http://localhost:3001"];
+    const allowedOrigins = new Set(
+      process.env.ALLOWED_ORIGINS
+        ? process.env.ALLOWED_ORIGINS.split(",")
+        : ["http://localhost:3000", "http://localhost:3001"],
+    );
 
     this.app.use(
       cors({
@@ -128,7 +159,7 @@ export class WebServer {
           // Allow requests with no origin (mobile apps, Postman, etc.)
           if (!origin) return callback(null, true);
 
-          if (allowedOrigins.includes(origin)) {
+          if (allowedOrigins.has(origin)) {
             callback(null, true);
           } else {
             logger.warn({ origin }, "Blocked by CORS policy");
@@ -146,7 +177,7 @@ export class WebServer {
     this.app.use(express.json({ limit: "1mb" }));
 
     // Global rate limiter (disabled in development)
-    if (process.env.NODE_ENV === "production") {
+    if (isProduction) {
       const globalLimiter = rateLimit({
         windowMs: 15 * 60 * 1000, // 15 minutes
         max: 1000, // Limit each IP to 1000 requests per window
@@ -195,6 +226,19 @@ export class WebServer {
   }
 
   private setupRoutes(): void {
+    // Any state-changing request may change the bot status. Clear the cached
+    // status again once it finishes, since reads during a slow start/stop
+    // re-encode the in-between state.
+    this.app.use("/api/", (req, res, next) => {
+      if (req.method !== "GET") {
+        this.statusJson = null;
+        res.on("finish", () => {
+          this.statusJson = null;
+        });
+      }
+      next();
+    });
+
     // Health check
     this.app.get("/api/health", (_req: Request, res: Response) => {
       res.json({ status: "ok", timestamp: new Date().toISOString() });
@@ -281,44 +325,7 @@ export class WebServer {
 
     // Get bot status (supports both single and portfolio mode)
     this.app.get("/api/status", (_req: Request, res: Response) => {
-      if (this.isPortfolioMode && this.portfolioBot) {
-        const status = this.portfolioBot.getStatus();
-        res.json({
-          ...status,
-          mode: "portfolio",
-          config: {
-            simulationMode: config.simulationMode,
-          },
-        });
-        return;
-      }
-
-      if (!this.bot) {
-        res.json({
-          status: "stopped",
-          currentPrice: 0,
-          gridConfig: null,
-          activeOrdersCount: 0,
-          totalPnl: 0,
-          tradesCount: 0,
-          uptime: 0,
-          riskReport: {},
-          mode: "single",
-          config: {
-            simulationMode: config.simulationMode,
-          },
-        });
-        return;
-      }
-
-      const status = this.bot.getStatus();
-      res.json({
-        ...status,
-        mode: "single",
-        config: {
-          simulationMode: config.simulationMode,
-        },
-      });
+      res.type("json").send(this.getStatusJson());
     });
 
     // Get grid levels
@@ -1139,10 +1146,9 @@ export class WebServer {
         }
 
         // In production, don't leak error details
-        const isDevelopment = process.env.NODE_ENV !== "production";
         res.status(500).json({
           error: "Internal server error",
-          ...(isDevelopment && {
+          ...(!isProduction && {
             details: err.message,
             stack: err.stack?.split("\n").slice(0, 5),
           }),
@@ -1151,6 +1157,71 @@ export class WebServer {
     );
   }
 
+  /**
+   * Bot status as served by /api/status; the same payload is pushed to
+   * WebSocket clients so dashboards don't need to poll for it
+   */
+  private getStatusPayload(): object {
+    if (this.isPortfolioMode && this.portfolioBot) {
+      const status = this.portfolioBot.getStatus();
+      return {
+        ...status,
+        mode: "portfolio",
+        config: {
+          simulationMode: config.simulationMode,
+        },
+      };
+    }
+
+    if (!this.bot) {
+      return {
+        status: "stopped",
+        currentPrice: 0,
+        gridConfig: null,
+        activeOrdersCount: 0,
+        totalPnl: 0,
+        tradesCount: 0,
+        uptime: 0,
+        riskReport: {},
+        mode: "single",
+        config: {
+          simulationMode: config.simulationMode,
+        },
+      };
+    }
+
+    const status = this.bot.getStatus();
+    return {
+      ...status,
+      mode: "single",
+      config: {
+        simulationMode: config.simulationMode,
+      },
+    };
+  }
+
+  /**
+   * getStatusPayload() as JSON, encoded at most once per broadcast period
+   */
+  private getStatusJson(): string {
+    const now = performance.now();
+    const cached = this.statusJson;
+    if (cached && now - cached.encodedAt < STATUS_BROADCAST_MS) {
+      return cached.json;
+    }
+
+    const json = JSON.stringify(this.getStatusPayload());
+    this.statusJson = { encodedAt: now, json };
+    return json;
+  }
+
+  /** WebSocket status frame built around the cached status JSON */
+  private getStatusFrame(): string {
+    const type =
+      this.isPortfolioMode && this.portfolioBot ? "portfolio" : "status";
+    return `{"type":"${type}","data":${this.getStatusJson()}}`;
+  }
+
   private setupWebSocket(): void {
     this.wss.on("connection", (ws: WebSocket, req) => {
       void (async () => {
@@ -1190,27 +1261,24 @@ export class WebServer {
           this.clients.add(ws);
 
           // Send initial status
-          if (this.isPortfolioMode && this.portfolioBot) {
-            ws.send(
-              JSON.stringify({
-                type: "portfolio",
-                data: this.portfolioBot.getStatus(),
-              }),
-            );
-          } else if (this.bot) {
-            ws.send(
-              JSON.stringify({ type: "status", data: this.bot.getStatus() }),
-            );
+          if ((this.isPortfolioMode && this.portfolioBot) || this.bot) {
+            ws.send(this.getStatusFrame());
           }
 
+          ws.on("pong", () => {
+            this.awaitingPong.delete(ws);
+          });
+
           ws.on("close", () => {
             logger.info("WebSocket client disconnected");
             this.clients.delete(ws);
+            this.awaitingPong.delete(ws);
           });
 
           ws.on("error", (error) => {
             logger.error({ error }, "WebSocket error");
             this.clients.delete(ws);
+            this.awaitingPong.delete(ws);
           });
         } catch (error) {
           logger.error({ error }, "WebSocket connection error");
@@ -1220,24 +1288,56 @@ export class WebServer {
     });
   }
 
-  private broadcast(message: object): void {
-    const data = JSON.stringify(message);
-    for (const client of this.clients) {
-      if (client.readyState === WebSocket.OPEN) {
-        client.send(data);
+  private broadcast(message: object | string): void {
+    // Encode once; given a string, ws would build a Buffer per client
+    const data = Buffer.from(
+      typeof message === "string" ? message : JSON.stringify(message),
+    );
+
+    if (this.clients.size <= BROADCAST_BATCH_SIZE) {
+      for (const client of this.clients) {
+        this.sendToClient(client, data);
+      }
+      return;
+    }
+
+    const clients = Array.from(this.clients);
+    const sendBatch = (start: number): void => {
+      const end = Math.min(start + BROADCAST_BATCH_SIZE, clients.length);
+      for (let i = start; i < end; i++) {
+        this.sendToClient(clients[i], data);
+      }
+      if (end < clients.length) setImmediate(sendBatch, end);
+    };
+    sendBatch(0);
+  }
+
+  private sendToClient(client: WebSocket, data: Buffer): void {
+    // Dead clients are removed by their close event or the ping sweep, not
+    // here, so broadcasting never mutates the client set
+    if (client.readyState !== WebSocket.OPEN) return;
+    if (client.bufferedAmount > MAX_CLIENT_BUFFERED_BYTES) {
+      if (logger.isLevelEnabled("debug")) {
+        logger.debug(
+          { bufferedAmount: client.bufferedAmount },
+          "Skipping update for slow WebSocket client",
+        );
       }
+      return;
     }
+    // ws.send never blocks on a peer; a failed write closes the socket
+    client.send(data, { binary: false });
   }
 
   private startStatusBroadcast(): void {
     if (this.statusInterval) return;
 
     this.statusInterval = setInterval(() => {
+      // Nothing to build or serialize until a dashboard is connected
+      if (this.clients.size === 0) return;
+
       if (this.isPortfolioMode && this.portfolioBot) {
-        this.broadcast({
-          type: "portfolio",
-          data: this.portfolioBot.getStatus(),
-        });
+        this.broadcast(this.getStatusFrame());
 
         // Also send per-pair details
         for (const symbol of this.portfolioBot.getAllPairs()) {
@@ -1256,11 +1356,11 @@ export class WebServer {
           }
         }
       } else if (this.bot) {
-        this.broadcast({ type: "status", data: this.bot.getStatus() });
+        this.broadcast(this.getStatusFrame());
         this.broadcast({ type: "grid", data: this.bot.getGridLevels() });
         this.broadcast({ type: "orders", data: this.bot.getActiveOrders() });
       }
-    }, 1000);
+    }, STATUS_BROADCAST_MS);
   }
 
   private stopStatusBroadcast(): void {
@@ -1270,7 +1370,51 @@ export class WebServer {
     }
   }
 
+  /**
+   * One timer pings every client, rather than a timer per connection, and
+   * sweeps out clients that closed without a close event reaching us
+   */
+  private startPing(): void {
+    if (this.pingInterval) return;
+
+    this.pingInterval = setInterval(() => {
+      for (const client of this.clients) {
+        if (client.readyState === WebSocket.CLOSED) {
+          this.clients.delete(client);
+          this.awaitingPong.delete(client);
+          continue;
+        }
+        if (this.awaitingPong.has(client)) {
+          logger.info("Terminating unresponsive WebSocket client");
+          this.awaitingPong.delete(client);
+          this.clients.delete(client);
+          client.terminate();
+          continue;
+        }
+        if (client.readyState === WebSocket.OPEN) {
+          this.awaitingPong.add(client);
+          client.ping();
+        }
+      }
+    }, WS_PING_INTERVAL_MS);
+  }
+
+  private stopPing(): void {
+    if (this.pingInterval) {
+      clearInterval(this.pingInterval);
+      this.pingInterval = null;
+    }
+    this.awaitingPong.clear();
+  }
+
   async start(): Promise<void> {
+    // Keep idle keep-alive connections open longer than the load balancer's
+    // 60s idle timeout, so it reuses them instead of reconnecting (or racing
+    // a socket Node's 5s default has already closed)
+    this.server.keepAliveTimeout = 65000;
+    this.server.headersTimeout = 66000;
+    this.startPing();
+
     return new Promise((resolve) => {
       this.server.listen(config.serverPort, () => {
         logger.info(
@@ -1284,6 +1428,7 @@ export class WebServer {
 
   async stop(): Promise<void> {
     this.stopStatusBroadcast();
+    this.stopPing();
 
     if (this.portfolioBot) {
       await this.portfolioBot.stop();
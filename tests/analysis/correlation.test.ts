@@ -3,10 +3,10 @@ import { CorrelationAnalyzer } from '../../src/analysis/correlation.js';
 
 jest.mock('../../src/utils/logger.js', () => ({
   createLogger: () => ({
-    info: jest.fn(),
-    warn: jest.fn(),
-    error: jest.fn(),
-    debug: jest.fn(),
+    info: () => {},
+    warn: () => {},
+    error: () => {},
+    debug: () => {},
   }),
 }));
 
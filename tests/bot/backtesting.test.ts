@@ -6,10 +6,11 @@ import { jest } from '@jest/globals';
 
 jest.mock('../../src/utils/logger.js', () => ({
   createLogger: () => ({
-    info: jest.fn(),
-    warn: jest.fn(),
-    error: jest.fn(),
-    debug: jest.fn(),
+    info: () => {},
+    warn: () => {},
+    error: () => {},
+    debug: () => {},
+    isLevelEnabled: () => false,
   }),
 }));
 
@@ -31,6 +32,18 @@ describe('GridBacktester', () => {
   const TEST_START_DATE = new Date(BASE_TIMESTAMP);
   const TEST_END_DATE = new Date(BASE_TIMESTAMP + DAY_MS * 19); // 20 days of data
 
+  // Known-good backtest config; tests spread it and override what they vary
+  const baseConfig = {
+    symbol: 'DOGEUSDT',
+    gridLower: 0.10,
+    gridUpper: 0.20,
+    gridCount: 5,
+    amountPerGrid: 10,
+    startDate: TEST_START_DATE,
+    endDate: TEST_END_DATE,
+    initialCapital: 1000,
+  };
+
   const mockPriceHistory = [
     { timestamp: BASE_TIMESTAMP + DAY_MS * 0, price: 0.10 },
     { timestamp: BASE_TIMESTAMP + DAY_MS * 1, price: 0.11 },
@@ -59,32 +72,14 @@ describe('GridBacktester', () => {
 
   describe('GridBacktester - Initialization', () => {
     it('should initialize with correct configuration', () => {
-      const config = {
-        symbol: 'DOGEUSDT',
-        gridLower: 0.10,
-        gridUpper: 0.20,
-        gridCount: 10,
-        amountPerGrid: 50,
-        startDate: TEST_START_DATE,
-        endDate: TEST_END_DATE,
-        initialCapital: 1000,
-      };
+      const config = { ...baseConfig, gridCount: 10, amountPerGrid: 50 };
 
       const backtester = new GridBacktester(config);
       expect(backtester).toBeDefined();
     });
 
     it('should create grid levels correctly', () => {
-      const config = {
-        symbol: 'DOGEUSDT',
-        gridLower: 0.10,
-        gridUpper: 0.20,
-        gridCount: 5,
-        amountPerGrid: 50,
-        startDate: TEST_START_DATE,
-        endDate: TEST_END_DATE,
-        initialCapital: 1000,
-      };
+      const config = { ...baseConfig, amountPerGrid: 50 };
 
       const backtester = new GridBacktester(config);
       const metrics = backtester.runBacktest();
@@ -96,18 +91,7 @@ describe('GridBacktester', () => {
 
   describe('GridBacktester - Trade Execution', () => {
     it('should execute buy orders when price drops to grid level', () => {
-      const config = {
-        symbol: 'DOGEUSDT',
-        gridLower: 0.10,
-        gridUpper: 0.20,
-        gridCount: 5,
-        amountPerGrid: 10,
-        startDate: TEST_START_DATE,
-        endDate: TEST_END_DATE,
-        initialCapital: 1000,
-      };
-
-      const backtester = new GridBacktester(config);
+      const backtester = new GridBacktester(baseConfig);
       const metrics = backtester.runBacktest();
 
       // Backtest should complete and return metrics
@@ -117,18 +101,7 @@ describe('GridBacktester', () => {
     });
 
     it('should execute sell orders when price rises after buy', () => {
-      const config = {
-        symbol: 'DOGEUSDT',
-        gridLower: 0.10,
-        gridUpper: 0.20,
-        gridCount: 5,
-        amountPerGrid: 10,
-        startDate: TEST_START_DATE,
-        endDate: TEST_END_DATE,
-        initialCapital: 1000,
-      };
-
-      const backtester = new GridBacktester(config);
+      const backtester = new GridBacktester(baseConfig);
       const metrics = backtester.runBacktest();
 
       // Backtest should complete and return valid trade arrays
@@ -144,13 +117,8 @@ describe('GridBacktester', () => {
 
     it('should not execute trades when insufficient capital', () => {
       const config = {
-        symbol: 'DOGEUSDT',
-        gridLower: 0.10,
-        gridUpper: 0.20,
-        gridCount: 5,
+        ...baseConfig,
         amountPerGrid: 1000, // Too large for initial capital
-        startDate: TEST_START_DATE,
-        endDate: TEST_END_DATE,
         initialCapital: 100, // Not enough
       };
 
@@ -163,99 +131,37 @@ describe('GridBacktester', () => {
   });
 
   describe('GridBacktester - Metrics Calculation', () => {
-    it('should calculate win rate correctly', () => {
-      const config = {
-        symbol: 'DOGEUSDT',
-        gridLower: 0.10,
-        gridUpper: 0.20,
-        gridCount: 5,
-        amountPerGrid: 10,
-        startDate: TEST_START_DATE,
-        endDate: TEST_END_DATE,
-        initialCapital: 1000,
-      };
+    // The backtest is deterministic and these tests only read its metrics,
+    // so run it once for the whole block
+    let metrics: ReturnType<GridBacktester['runBacktest']>;
 
-      const backtester = new GridBacktester(config);
-      const metrics = backtester.runBacktest();
+    beforeAll(() => {
+      metrics = new GridBacktester(baseConfig).runBacktest();
+    });
 
+    it('should calculate win rate correctly', () => {
       expect(metrics.winRate).toBeGreaterThanOrEqual(0);
       expect(metrics.winRate).toBeLessThanOrEqual(100);
       expect(metrics.winningTrades + metrics.losingTrades).toBe(metrics.totalTrades);
     });
 
     it('should calculate total return correctly', () => {
-      const config = {
-        symbol: 'DOGEUSDT',
-        gridLower: 0.10,
-        gridUpper: 0.20,
-        gridCount: 5,
-        amountPerGrid: 10,
-        startDate: TEST_START_DATE,
-        endDate: TEST_END_DATE,
-        initialCapital: 1000,
-      };
-
-      const backtester = new GridBacktester(config);
-      const metrics = backtester.runBacktest();
-
       expect(metrics.totalReturn).toBeDefined();
       expect(typeof metrics.totalReturn).toBe('number');
     });
 
     it('should calculate Sharpe ratio', () => {
-      const config = {
-        symbol: 'DOGEUSDT',
-        gridLower: 0.10,
-        gridUpper: 0.20,
-        gridCount: 5,
-        amountPerGrid: 10,
-        startDate: TEST_START_DATE,
-        endDate: TEST_END_DATE,
-        initialCapital: 1000,
-      };
-
-      const backtester = new GridBacktester(config);
-      const metrics = backtester.runBacktest();
-
       expect(metrics.sharpeRatio).toBeDefined();
       expect(typeof metrics.sharpeRatio).toBe('number');
     });
 
     it('should calculate max drawdown', () => {
-      const config = {
-        symbol: 'DOGEUSDT',
-        gridLower: 0.10,
-        gridUpper: 0.20,
-        gridCount: 5,
-        amountPerGrid: 10,
-        startDate: TEST_START_DATE,
-        endDate: TEST_END_DATE,
-        initialCapital: 1000,
-      };
-
-      const backtester = new GridBacktester(config);
-      const metrics = backtester.runBacktest();
-
       expect(metrics.maxDrawdown).toBeGreaterThanOrEqual(0);
       expect(metrics.maxDrawdownPercent).toBeGreaterThanOrEqual(0);
       expect(metrics.maxDrawdownPercent).toBeLessThanOrEqual(100);
     });
 
     it('should generate equity curve', () => {
-      const config = {
-        symbol: 'DOGEUSDT',
-        gridLower: 0.10,
-        gridUpper: 0.20,
-        gridCount: 5,
-        amountPerGrid: 10,
-        startDate: TEST_START_DATE,
-        endDate: TEST_END_DATE,
-        initialCapital: 1000,
-      };
-
-      const backtester = new GridBacktester(config);
-      const metrics = backtester.runBacktest();
-
       expect(metrics.equityCurve).toBeDefined();
       expect(Array.isArray(metrics.equityCurve)).toBe(true);
       // Equity curve length depends on price data availability
@@ -263,20 +169,6 @@ describe('GridBacktester', () => {
     });
 
     it('should calculate profit factor', () => {
-      const config = {
-        symbol: 'DOGEUSDT',
-        gridLower: 0.10,
-        gridUpper: 0.20,
-        gridCount: 5,
-        amountPerGrid: 10,
-        startDate: TEST_START_DATE,
-        endDate: TEST_END_DATE,
-        initialCapital: 1000,
-      };
-
-      const backtester = new GridBacktester(config);
-      const metrics = backtester.runBacktest();
-
       expect(metrics.profitFactor).toBeDefined();
       expect(typeof metrics.profitFactor).toBe('number');
       expect(metrics.profitFactor).toBeGreaterThanOrEqual(0);
@@ -311,15 +203,20 @@ describe('GridBacktester', () => {
   });
 
   describe('optimizeGridParameters', () => {
-    it('should find optimal grid configuration', () => {
-      const result = optimizeGridParameters(
+    // Each run sweeps 20 configurations; share one for the read-only tests
+    let result: ReturnType<typeof optimizeGridParameters>;
+
+    beforeAll(() => {
+      result = optimizeGridParameters(
         'DOGEUSDT',
         TEST_START_DATE,
         TEST_END_DATE,
         1000,
         testPriceProvider
       );
+    });
 
+    it('should find optimal grid configuration', () => {
       expect(result).toBeDefined();
       expect(result.bestConfig).toBeDefined();
       expect(result.bestMetrics).toBeDefined();
@@ -328,27 +225,11 @@ describe('GridBacktester', () => {
     });
 
     it('should test multiple grid configurations', () => {
-      const result = optimizeGridParameters(
-        'DOGEUSDT',
-        TEST_START_DATE,
-        TEST_END_DATE,
-        1000,
-        testPriceProvider
-      );
-
       // Should test gridCounts [5, 8, 10, 15, 20] * rangeMultipliers [0.15, 0.20, 0.25, 0.30] = 20 configs
       expect(result.allResults.length).toBeGreaterThan(0);
     });
 
     it('should prioritize Sharpe ratio over total return', () => {
-      const result = optimizeGridParameters(
-        'DOGEUSDT',
-        TEST_START_DATE,
-        TEST_END_DATE,
-        1000,
-        testPriceProvider
-      );
-
       // Best config should have the highest Sharpe ratio
       const bestSharpe = result.bestMetrics.sharpeRatio;
       const allSharpes = result.allResults.map((r) => r.metrics.sharpeRatio);
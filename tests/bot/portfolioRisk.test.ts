@@ -3,30 +3,38 @@ import { PortfolioRiskManager } from '../../src/bot/portfolioRisk.js';
 
 jest.mock('../../src/utils/logger.js', () => ({
   createLogger: () => ({
-    info: jest.fn(),
-    warn: jest.fn(),
-    error: jest.fn(),
-    debug: jest.fn(),
+    info: () => {},
+    warn: () => {},
+    error: () => {},
+    debug: () => {},
   }),
 }));
 
 describe('PortfolioRiskManager', () => {
   let riskManager: PortfolioRiskManager;
 
+  it.each([
+    // strategy, exposure %, daily loss %, drawdown %, loss streak
+    ['conservative', 60, 2.5, 10, 3],
+    ['moderate', 75, 5, 15, 5],
+    ['aggressive', 90, 10, 25, 7],
+  ] as const)(
+    'should initialize with %s limits',
+    (strategy, exposure, dailyLoss, drawdown, lossStreak) => {
+      const limits = new PortfolioRiskManager(strategy).getLimits();
+
+      expect(limits.maxTotalExposure).toBe(exposure);
+      expect(limits.maxDailyLossPercent).toBe(dailyLoss);
+      expect(limits.maxDrawdownPercent).toBe(drawdown);
+      expect(limits.pauseOnConsecutiveLosses).toBe(lossStreak);
+    }
+  );
+
   describe('Conservative Strategy', () => {
     beforeEach(() => {
       riskManager = new PortfolioRiskManager('conservative');
     });
 
-    it('should initialize with conservative limits', () => {
-      const limits = riskManager.getLimits();
-
-      expect(limits.maxTotalExposure).toBe(60); // 60%
-      expect(limits.maxDailyLossPercent).toBe(2.5); // 2.5%
-      expect(limits.maxDrawdownPercent).toBe(10); // 10%
-      expect(limits.pauseOnConsecutiveLosses).toBe(3);
-    });
-
     it('should block trades after 3 consecutive losses', () => {
       riskManager.updatePortfolioValue(2000);
 
@@ -45,15 +53,6 @@ describe('PortfolioRiskManager', () => {
       riskManager = new PortfolioRiskManager('moderate');
     });
 
-    it('should initialize with moderate limits', () => {
-      const limits = riskManager.getLimits();
-
-      expect(limits.maxTotalExposure).toBe(75); // 75%
-      expect(limits.maxDailyLossPercent).toBe(5); // 5%
-      expect(limits.maxDrawdownPercent).toBe(15); // 15%
-      expect(limits.pauseOnConsecutiveLosses).toBe(5);
-    });
-
     it('should block trades after 5 consecutive losses', () => {
       riskManager.updatePortfolioValue(2000);
 
@@ -71,15 +70,6 @@ describe('PortfolioRiskManager', () => {
       riskManager = new PortfolioRiskManager('aggressive');
     });
 
-    it('should initialize with aggressive limits', () => {
-      const limits = riskManager.getLimits();
-
-      expect(limits.maxTotalExposure).toBe(90); // 90%
-      expect(limits.maxDailyLossPercent).toBe(10); // 10%
-      expect(limits.maxDrawdownPercent).toBe(25); // 25%
-      expect(limits.pauseOnConsecutiveLosses).toBe(7);
-    });
-
     it('should be more tolerant of losses', () => {
       riskManager.updatePortfolioValue(2000);
 
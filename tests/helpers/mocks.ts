@@ -101,6 +101,7 @@ export function createMockDatabase() {
     savePortfolioSnapshot: jest.fn(),
     getPortfolioSnapshots: jest.fn().mockReturnValue([]),
     savePricePoint: jest.fn(),
+    savePricePoints: jest.fn(),
     getPriceHistory: jest.fn().mockReturnValue([]),
     getLatestPrice: jest.fn().mockReturnValue(null),
     cleanup: jest.fn(),
@@ -119,6 +120,7 @@ export function createMockLogger() {
     debug: jest.fn(),
     trace: jest.fn(),
     fatal: jest.fn(),
+    isLevelEnabled: jest.fn(() => false),
   };
 }
 
@@ -8,10 +8,10 @@ import type { Alert } from '../../src/services/notifications.js';
 
 jest.mock('../../src/utils/logger.js', () => ({
   createLogger: () => ({
-    info: jest.fn(),
-    warn: jest.fn(),
-    error: jest.fn(),
-    debug: jest.fn(),
+    info: () => {},
+    warn: () => {},
+    error: () => {},
+    debug: () => {},
   }),
 }));
 
@@ -12,10 +12,11 @@ jest.mock('../../src/models/database.js', () => ({
 
 jest.mock('../../src/utils/logger.js', () => ({
   createLogger: () => ({
-    info: jest.fn(),
-    warn: jest.fn(),
-    error: jest.fn(),
-    debug: jest.fn(),
+    info: () => {},
+    warn: () => {},
+    error: () => {},
+    debug: () => {},
+    isLevelEnabled: () => false,
   }),
 }));
 
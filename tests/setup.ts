@@ -10,3 +10,4 @@ process.env.BINANCE_TESTNET = 'true';
 process.env.BINANCE_API_KEY = 'test_api_key';
 process.env.BINANCE_API_SECRET = 'test_api_secret';
 process.env.LOG_LEVEL = 'error'; // Reduce noise in tests
+process.env.DB_PATH = ':memory:'; // Never touch data/trading.db; no file I/O
@@ -0,0 +1,25 @@
+/**
+ * Binary Search Helper Tests
+ */
+
+import { bisectLeft, bisectRight } from '../../src/utils/bisect.js';
+
+describe('bisect', () => {
+  const levels = Float64Array.from([0.1, 0.2, 0.2, 0.3, 0.4]);
+
+  it('should find insertion points around equal values', () => {
+    expect(bisectLeft(levels, 0.2)).toBe(1);
+    expect(bisectRight(levels, 0.2)).toBe(3);
+  });
+
+  it('should find insertion points between values', () => {
+    expect(bisectLeft(levels, 0.25)).toBe(3);
+    expect(bisectRight(levels, 0.25)).toBe(3);
+  });
+
+  it('should clamp to the array bounds', () => {
+    expect(bisectLeft(levels, 0.05)).toBe(0);
+    expect(bisectRight(levels, 0.5)).toBe(levels.length);
+    expect(bisectLeft([], 1)).toBe(0);
+  });
+});
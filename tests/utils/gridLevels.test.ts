@@ -0,0 +1,45 @@
+/**
+ * Grid Ladder Tests
+ */
+
+import { computeGridLevels } from '../../src/utils/config.js';
+
+describe('computeGridLevels', () => {
+  it.each([
+    ['arithmetic', 45000],
+    ['geometric', 50000],
+  ] as const)('should span the %s grid from lower to upper', (gridType, upper) => {
+    const levels = computeGridLevels(40000, upper, 10, gridType);
+
+    expect(levels).toHaveLength(11);
+    expect(levels[0]).toBeCloseTo(40000, 6);
+    expect(levels[levels.length - 1]).toBeCloseTo(upper, 6);
+
+    // Arithmetic grids have a constant step, geometric grids a constant ratio
+    const step = (i: number) =>
+      gridType === 'arithmetic' ? levels[i] - levels[i - 1] : levels[i] / levels[i - 1];
+    for (let i = 2; i < levels.length; i++) {
+      expect(step(i)).toBeCloseTo(step(1), 6);
+    }
+  });
+
+  it('should return the memoized ladder for the same parameters', () => {
+    const first = computeGridLevels(0.1, 0.2, 5, 'arithmetic');
+
+    expect(computeGridLevels(0.1, 0.2, 5, 'arithmetic')).toBe(first);
+    expect(computeGridLevels(0.1, 0.2, 5, 'geometric')).not.toBe(first);
+    expect(Object.isFrozen(first)).toBe(true);
+  });
+
+  it('should evict the least recently used ladder once the cache is full', () => {
+    const kept = computeGridLevels(1, 2, 4, 'arithmetic');
+    const evicted = computeGridLevels(1, 2, 5, 'arithmetic');
+    for (let i = 0; i < 32; i++) {
+      computeGridLevels(1, 2, 4, 'arithmetic');
+      computeGridLevels(10, 20 + i, 4, 'arithmetic');
+    }
+
+    expect(computeGridLevels(1, 2, 4, 'arithmetic')).toBe(kept);
+    expect(computeGridLevels(1, 2, 5, 'arithmetic')).not.toBe(evicted);
+  });
+});
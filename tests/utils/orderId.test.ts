@@ -0,0 +1,19 @@
+/**
+ * Client Order Id Helper Tests
+ */
+
+import { parseGridLevel } from '../../src/utils/orderId.js';
+
+describe('parseGridLevel', () => {
+  it('should read the level from grid order ids', () => {
+    expect(parseGridLevel('grid_0_BUY_1700000000000')).toBe(0);
+    expect(parseGridLevel('grid_12_SELL_1700000000000')).toBe(12);
+    expect(parseGridLevel('grid_7')).toBe(7);
+  });
+
+  it('should ignore ids without a grid level', () => {
+    expect(parseGridLevel('sim_1700000000000')).toBeUndefined();
+    expect(parseGridLevel('grid__BUY')).toBeUndefined();
+    expect(parseGridLevel('')).toBeUndefined();
+  });
+});
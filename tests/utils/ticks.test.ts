@@ -0,0 +1,62 @@
+/**
+ * Tick Size Rounding Tests
+ */
+
+import {
+  parseTickSize,
+  floorToTick,
+  formatTick,
+} from '../../src/utils/ticks.js';
+
+describe('Tick Size Rounding', () => {
+  describe('parseTickSize', () => {
+    it('should ignore trailing zeros in the filter value', () => {
+      expect(parseTickSize('0.00001000')).toEqual({
+        decimals: 5,
+        scale: 100000,
+        units: 1,
+      });
+      expect(parseTickSize('0.05000000')).toEqual({
+        decimals: 2,
+        scale: 100,
+        units: 5,
+      });
+      expect(parseTickSize('1.00000000')).toEqual({
+        decimals: 0,
+        scale: 1,
+        units: 1,
+      });
+    });
+
+    it('should reject zero sizes', () => {
+      expect(parseTickSize('0.00000000')).toBeUndefined();
+    });
+  });
+
+  describe('floorToTick', () => {
+    it('should floor to exact decimal ticks', () => {
+      const tick = parseTickSize('0.01000000')!;
+
+      expect(floorToTick(0.29, tick)).toBe(0.29);
+      expect(floorToTick(0.3, tick)).toBe(0.3);
+      expect(floorToTick(1.23999, tick)).toBe(1.23);
+    });
+
+    it('should handle non power-of-ten ticks', () => {
+      const tick = parseTickSize('0.05000000')!;
+
+      expect(floorToTick(1.24, tick)).toBe(1.2);
+      expect(floorToTick(1.25, tick)).toBe(1.25);
+    });
+  });
+
+  describe('formatTick', () => {
+    it('should print plain decimals at the tick precision', () => {
+      expect(formatTick(0.3, parseTickSize('0.01000000')!)).toBe('0.30');
+      expect(formatTick(1.2e-7, parseTickSize('0.00000001')!)).toBe(
+        '0.00000012',
+      );
+      expect(formatTick(42, parseTickSize('1.00000000')!)).toBe('42');
+    });
+  });
+});